@@ -3,17 +3,19 @@ Domain Entities Package
 Core business entities for financial analysis
 """
 from .financial_news import FinancialNews
-from .market_data import MarketData, Stock, MarketMetrics
+from .market_data import MarketData, Stock, MarketMetrics, StockQuote
 from .analysis_result import AnalysisResult, SentimentScore
-from .market import Market, MarketStatus
+from .market import Market, MarketStatus, MarketSnapshot
 
 __all__ = [
     'FinancialNews',
     'MarketData', 
     'Stock',
     'MarketMetrics',
+    'StockQuote',
     'AnalysisResult',
     'SentimentScore',
     'Market',
-    'MarketStatus'
+    'MarketStatus',
+    'MarketSnapshot'
 ]
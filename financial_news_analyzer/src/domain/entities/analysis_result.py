@@ -4,7 +4,7 @@ Represents the results of financial analysis operations
 """
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Tuple
 from enum import Enum
 
 class SentimentType(Enum):
@@ -23,14 +23,14 @@ class AnalysisType(Enum):
     NEWS_IMPACT_ANALYSIS = "news_impact_analysis"
     MARKET_CORRELATION = "market_correlation"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SentimentScore:
     """
     Detailed sentiment scoring with confidence metrics
     
     Clean Code Principles:
     - Descriptive naming for clarity
-    - Immutable data structure
+    - Immutable data structure (frozen, slotted, hashable)
     - Clear validation rules
     """
     
@@ -46,7 +46,7 @@ class SentimentScore:
     
     # Analysis metadata
     analyzed_text_length: Optional[int] = None
-    key_phrases: Optional[List[str]] = None
+    key_phrases: Optional[Tuple[str, ...]] = None
     
     def __post_init__(self):
         """Validate sentiment score bounds"""
@@ -56,9 +56,13 @@ class SentimentScore:
         if not 0.0 <= self.confidence <= 1.0:
             raise ValueError("Confidence must be between 0.0 and 1.0")
         
+        # Frozen instance: normalize fields through object.__setattr__
+        if self.key_phrases is not None and not isinstance(self.key_phrases, tuple):
+            object.__setattr__(self, "key_phrases", tuple(self.key_phrases))
+        
         # Auto-determine sentiment type if not provided
         if self.sentiment_type is None:
-            self.sentiment_type = self._determine_sentiment_type()
+            object.__setattr__(self, "sentiment_type", self._determine_sentiment_type())
     
     def _determine_sentiment_type(self) -> SentimentType:
         """Determine sentiment type based on score"""
@@ -255,7 +259,7 @@ class AnalysisResult:
                 "negative_probability": self.sentiment_score.negative_probability,
                 "neutral_probability": self.sentiment_score.neutral_probability,
                 "analyzed_text_length": self.sentiment_score.analyzed_text_length,
-                "key_phrases": self.sentiment_score.key_phrases
+                "key_phrases": list(self.sentiment_score.key_phrases) if self.sentiment_score.key_phrases is not None else None
             }
         
         return result
@@ -29,7 +29,7 @@ class NewsSource(Enum):
     CNBC = "cnbc"
     OTHER = "other"
 
-@dataclass
+@dataclass(slots=True)
 class FinancialNews:
     """
     Core entity representing a financial news article
@@ -40,6 +40,8 @@ class FinancialNews:
     - Liskov Substitution: Can be substituted by subclasses
     - Interface Segregation: Clean, focused interface
     - Dependency Inversion: Depends on abstractions (enums)
+    
+    Uses __slots__ (no per-instance __dict__) since repositories hold many instances.
     """
     
     # Core identifiers
@@ -3,9 +3,11 @@ Market Entity
 Represents financial markets with status and schedule information
 """
 from dataclasses import dataclass
-from datetime import datetime, time
+from functools import cached_property
+from datetime import datetime, time, timedelta
 from typing import Optional, Dict, Any
 from enum import Enum
+from types import MappingProxyType
 import pytz
 
 class MarketStatus(Enum):
@@ -16,6 +18,34 @@ class MarketStatus(Enum):
     AFTER_HOURS = "after_hours"
     HOLIDAY = "holiday"
     MAINTENANCE = "maintenance"
+    
+    @property
+    def emoji(self) -> str:
+        """Emoji shown next to this status"""
+        return _STATUS_EMOJIS[self]
+    
+    @property
+    def color(self) -> str:
+        """Color code used to display this status"""
+        return _STATUS_COLORS[self]
+
+_STATUS_EMOJIS = MappingProxyType({
+    MarketStatus.OPEN: "🟢",
+    MarketStatus.CLOSED: "🔴",
+    MarketStatus.PRE_MARKET: "🟡",
+    MarketStatus.AFTER_HOURS: "🟠",
+    MarketStatus.HOLIDAY: "🔵",
+    MarketStatus.MAINTENANCE: "⚪"
+})
+
+_STATUS_COLORS = MappingProxyType({
+    MarketStatus.OPEN: "#28a745",
+    MarketStatus.CLOSED: "#dc3545",
+    MarketStatus.PRE_MARKET: "#ffc107",
+    MarketStatus.AFTER_HOURS: "#fd7e14",
+    MarketStatus.HOLIDAY: "#007bff",
+    MarketStatus.MAINTENANCE: "#6c757d"
+})
 
 class MarketRegion(Enum):
     """Global market regions"""
@@ -24,6 +54,14 @@ class MarketRegion(Enum):
     ASIA_PACIFIC = "asia_pacific"
     MENA_AFRICA = "mena_africa"
 
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Point-in-time view of a market's local clock and trading status"""
+    local_time: str  # HH:MM
+    local_date: str  # MM/DD
+    status: MarketStatus
+    countdown: Optional[str] = None  # Time until close when open, until open when closed
+
 @dataclass
 class Market:
     """
@@ -72,10 +110,15 @@ class Market:
         if self.current_status is None:
             self.current_status = self.get_current_status()
     
+    @cached_property
+    def tzinfo(self) -> pytz.BaseTzInfo:
+        """Resolved timezone object, looked up once per market"""
+        return pytz.timezone(self.timezone)
+    
     def get_current_status(self) -> MarketStatus:
         """Calculate current market status based on time"""
         try:
-            tz = pytz.timezone(self.timezone)
+            tz = self.tzinfo
             current_time = datetime.now(tz).time()
             
             # Check if market is currently open
@@ -98,7 +141,7 @@ class Market:
     def get_local_time(self) -> datetime:
         """Get current local time for this market"""
         try:
-            tz = pytz.timezone(self.timezone)
+            tz = self.tzinfo
             return datetime.now(tz)
         except Exception:
             return datetime.now()
@@ -116,28 +159,12 @@ class Market:
     @property
     def status_emoji(self) -> str:
         """Get emoji representation of market status"""
-        emoji_map = {
-            MarketStatus.OPEN: "🟢",
-            MarketStatus.CLOSED: "🔴",
-            MarketStatus.PRE_MARKET: "🟡",
-            MarketStatus.AFTER_HOURS: "🟠",
-            MarketStatus.HOLIDAY: "🔵",
-            MarketStatus.MAINTENANCE: "⚪"
-        }
-        return emoji_map.get(self.current_status, "❓")
+        return _STATUS_EMOJIS.get(self.current_status, "❓")
     
     @property
     def status_color(self) -> str:
         """Get color code for market status"""
-        color_map = {
-            MarketStatus.OPEN: "#28a745",
-            MarketStatus.CLOSED: "#dc3545",
-            MarketStatus.PRE_MARKET: "#ffc107",
-            MarketStatus.AFTER_HOURS: "#fd7e14",
-            MarketStatus.HOLIDAY: "#007bff",
-            MarketStatus.MAINTENANCE: "#6c757d"
-        }
-        return color_map.get(self.current_status, "#6c757d")
+        return _STATUS_COLORS.get(self.current_status, "#6c757d")
     
     @property
     def display_name(self) -> str:
@@ -159,32 +186,7 @@ class Market:
             return None
         
         try:
-            tz = pytz.timezone(self.timezone)
-            now = datetime.now(tz)
-            
-            # Calculate next opening time
-            next_open = now.replace(
-                hour=self.open_time.hour,
-                minute=self.open_time.minute,
-                second=0,
-                microsecond=0
-            )
-            
-            # If opening time has passed today, move to next day
-            if next_open <= now:
-                next_open = next_open.replace(day=next_open.day + 1)
-            
-            time_diff = next_open - now
-            hours = int(time_diff.total_seconds() // 3600)
-            minutes = int((time_diff.total_seconds() % 3600) // 60)
-            
-            if hours > 24:
-                days = hours // 24
-                hours = hours % 24
-                return f"{days}d {hours}h {minutes}m"
-            else:
-                return f"{hours}h {minutes}m"
-                
+            return self._time_until_open_from(datetime.now(self.tzinfo))
         except Exception:
             return "Unknown"
     
@@ -194,28 +196,81 @@ class Market:
             return None
         
         try:
-            tz = pytz.timezone(self.timezone)
-            now = datetime.now(tz)
-            
-            close_today = now.replace(
-                hour=self.close_time.hour,
-                minute=self.close_time.minute,
-                second=0,
-                microsecond=0
-            )
-            
-            if close_today <= now:
-                return "Closing soon"
-            
-            time_diff = close_today - now
-            hours = int(time_diff.total_seconds() // 3600)
-            minutes = int((time_diff.total_seconds() % 3600) // 60)
-            
-            return f"{hours}h {minutes}m"
-            
+            return self._time_until_close_from(datetime.now(self.tzinfo))
         except Exception:
             return "Unknown"
     
+    def _time_until_open_from(self, now: datetime) -> str:
+        """Format the time from local datetime now until the next opening"""
+        # Calculate next opening time
+        next_open = now.replace(
+            hour=self.open_time.hour,
+            minute=self.open_time.minute,
+            second=0,
+            microsecond=0
+        )
+        
+        # If opening time has passed today, move to next day
+        if next_open <= now:
+            next_open += timedelta(days=1)
+        
+        time_diff = next_open - now
+        hours = int(time_diff.total_seconds() // 3600)
+        minutes = int((time_diff.total_seconds() % 3600) // 60)
+        
+        if hours > 24:
+            days = hours // 24
+            hours = hours % 24
+            return f"{days}d {hours}h {minutes}m"
+        else:
+            return f"{hours}h {minutes}m"
+    
+    def _time_until_close_from(self, now: datetime) -> str:
+        """Format the time from local datetime now until today's close"""
+        close_today = now.replace(
+            hour=self.close_time.hour,
+            minute=self.close_time.minute,
+            second=0,
+            microsecond=0
+        )
+        
+        if close_today <= now:
+            return "Closing soon"
+        
+        time_diff = close_today - now
+        hours = int(time_diff.total_seconds() // 3600)
+        minutes = int((time_diff.total_seconds() % 3600) // 60)
+        
+        return f"{hours}h {minutes}m"
+    
+    def snapshot(self, now_utc: datetime) -> 'MarketSnapshot':
+        """
+        Local clock, status and countdown at one shared instant
+        
+        Lets a caller rendering many markets read the clock once and derive
+        every market's view from it, instead of each accessor calling now().
+        
+        Args:
+            now_utc: Timezone-aware current time
+        """
+        try:
+            local_now = now_utc.astimezone(self.tzinfo)
+        except Exception:
+            # Fallback if timezone calculation fails
+            local_now = now_utc.astimezone()
+            return MarketSnapshot(local_now.strftime("%H:%M"), local_now.strftime("%m/%d"),
+                                  MarketStatus.CLOSED, "Unknown")
+        
+        if self._is_time_between(local_now.time(), self.open_time, self.close_time):
+            status = MarketStatus.OPEN
+            countdown = self._time_until_close_from(local_now)
+        else:
+            status = MarketStatus.CLOSED
+            countdown = self._time_until_open_from(local_now)
+        
+        return MarketSnapshot(local_now.strftime("%H:%M"), local_now.strftime("%m/%d"),
+                              status, countdown)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
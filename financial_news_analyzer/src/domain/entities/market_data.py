@@ -4,7 +4,7 @@ Represents market data, stocks, and financial metrics
 """
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TypedDict
 from enum import Enum
 from decimal import Decimal
 
@@ -29,7 +29,7 @@ class Currency(Enum):
     CHF = "CHF"
     TRY = "TRY"
 
-@dataclass
+@dataclass(slots=True)
 class Stock:
     """
     Represents a stock/security with current market data
@@ -38,6 +38,8 @@ class Stock:
     - Meaningful names for all properties
     - Single responsibility for stock data
     - Immutable where possible
+    
+    Uses __slots__ (no per-instance __dict__) since repositories hold many instances.
     """
     
     # Identifiers
@@ -122,6 +124,23 @@ class Stock:
         sign = "+" if self.change_amount >= 0 else ""
         return f"{sign}{self.change_amount:.2f} ({sign}{self.change_percent:.2f}%)"
 
+class StockQuote(TypedDict):
+    """One quote row as returned by a market service's get_current_prices(); every key is always present"""
+    symbol: str
+    company_name: str
+    sector: str
+    current_price: float
+    change_amount: float
+    change_percent: float
+    volume: int
+    day_high: float
+    day_low: float
+    market_cap: float  # in billions
+    pe_ratio: float
+    week_52_high: float
+    week_52_low: float
+    last_updated: str
+
 @dataclass
 class MarketMetrics:
     """
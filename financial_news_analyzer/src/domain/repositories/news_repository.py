@@ -53,7 +53,7 @@ class INewsRepository(ABC):
             criteria: Search criteria object
             
         Returns:
-            List of matching news articles
+            List of matching news articles, newest first (by published_at)
         """
         pass
     
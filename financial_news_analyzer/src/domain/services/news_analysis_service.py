@@ -250,6 +250,31 @@ class NewsAnalysisService:
         Returns:
             Complete analysis result
         """
+        keywords, symbols = self._prepare_article(news)
+        
+        # Perform sentiment analysis
+        sentiment_result = self._sentiment_service.analyze_news(news)
+        
+        return self._build_article_result(news, keywords, symbols, sentiment_result)
+    
+    def analyze_news_batch(self, news_list: List[FinancialNews]) -> List[AnalysisResult]:
+        """Analyze multiple news articles efficiently"""
+        if len(news_list) <= 1:
+            return [self.analyze_news_article(news) for news in news_list]
+        
+        prepared = [self._prepare_article(news) for news in news_list]
+        
+        # Sentiment for the whole batch in one pass
+        sentiment_results = self._sentiment_service.analyze_news_batch(news_list)
+        
+        return [
+            self._build_article_result(news, keywords, symbols, sentiment_result)
+            for news, (keywords, symbols), sentiment_result
+            in zip(news_list, prepared, sentiment_results)
+        ]
+    
+    def _prepare_article(self, news: FinancialNews) -> Tuple[List[str], List[str]]:
+        """Extract keywords, symbols and summary and store them on the article"""
         # Extract keywords and symbols
         keywords = self._processor.extract_keywords(news.content)
         symbols = self._processor.extract_symbols(news.content)
@@ -263,9 +288,11 @@ class NewsAnalysisService:
         if not news.summary:
             news.summary = summary
         
-        # Perform sentiment analysis
-        sentiment_result = self._sentiment_service.analyze_news(news)
-        
+        return keywords, symbols
+    
+    def _build_article_result(self, news: FinancialNews, keywords: List[str], symbols: List[str],
+                              sentiment_result: AnalysisResult) -> AnalysisResult:
+        """Create the comprehensive analysis result for a prepared article"""
         # Calculate additional metrics
         impact_score = self._calculate_news_impact(news, sentiment_result)
         relevance_score = self._calculate_relevance_score(news)
@@ -305,10 +332,6 @@ class NewsAnalysisService:
         
         return analysis_result
     
-    def analyze_news_batch(self, news_list: List[FinancialNews]) -> List[AnalysisResult]:
-        """Analyze multiple news articles efficiently"""
-        return [self.analyze_news_article(news) for news in news_list]
-    
     def find_trending_topics(self, news_list: List[FinancialNews], 
                            time_window_hours: int = 24) -> Dict[str, Any]:
         """
@@ -5,10 +5,54 @@ Advanced sentiment analysis for financial texts
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 import re
+import math
+import itertools
+from bisect import bisect_left
 from datetime import datetime
+from types import MappingProxyType
 
 from ..entities.analysis_result import SentimentScore, SentimentType, AnalysisResult, AnalysisType
-from ..entities.financial_news import FinancialNews
+from ..entities.financial_news import FinancialNews, NewsCategory, NewsSource
+
+# Maximum entropy for 3 categories, inverted so confidence is a multiply
+_INV_LOG3 = 1.0 / math.log(3.0)
+
+# Monotonic suffix for analysis result IDs (unique within the process)
+_result_ids = itertools.count()
+
+# Impact multipliers keyed by enum member; every member is present (1.0 for unlisted ones)
+_CATEGORY_MULTIPLIERS = MappingProxyType({
+    category: {
+        NewsCategory.EARNINGS: 1.2,
+        NewsCategory.ECONOMIC_INDICATORS: 1.3,
+        NewsCategory.REGULATORY: 1.1,
+        NewsCategory.MARKET_ANALYSIS: 1.0,
+    }.get(category, 1.0)
+    for category in NewsCategory
+})
+_SOURCE_MULTIPLIERS = MappingProxyType({
+    source: {
+        NewsSource.BLOOMBERG: 1.1,
+        NewsSource.REUTERS: 1.1,
+        NewsSource.WALL_STREET_JOURNAL: 1.05,
+    }.get(source, 1.0)
+    for source in NewsSource
+})
+
+# Punctuation removed once per text so tokens need no per-word strip()
+_PUNCT_TABLE = str.maketrans('', '', '.,!?')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+
+# Upper bounds (inclusive) of each sentiment band. bisect_left returns the
+# first band whose bound is >= score, which matches the `score <= bound` rule.
+_SENTIMENT_THRESHOLDS = (-0.6, -0.2, 0.2, 0.6)
+_SENTIMENT_TYPES = (
+    SentimentType.VERY_NEGATIVE,
+    SentimentType.NEGATIVE,
+    SentimentType.NEUTRAL,
+    SentimentType.POSITIVE,
+    SentimentType.VERY_POSITIVE,
+)
 
 class ISentimentAnalyzer(ABC):
     """
@@ -126,11 +170,11 @@ class FinancialSentimentAnalyzer(ISentimentAnalyzer):
     
     def _preprocess_text(self, text: str) -> str:
         """Clean and preprocess text for analysis"""
-        # Convert to lowercase
-        text = text.lower()
+        # Convert to lowercase and drop basic punctuation
+        text = text.lower().translate(_PUNCT_TABLE)
         
-        # Remove special characters but keep spaces and basic punctuation
-        text = re.sub(r'[^\w\s\.\,\!\?]', ' ', text)
+        # Replace remaining special characters with spaces
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
         
         # Remove extra whitespace
         text = ' '.join(text.split())
@@ -140,15 +184,14 @@ class FinancialSentimentAnalyzer(ISentimentAnalyzer):
     def _extract_key_phrases(self, text: str) -> List[str]:
         """Extract key financial phrases from text"""
         words = text.split()
-        phrases = []
+        phrases = {}  # Insertion-ordered set
         
         # Extract individual keywords
         for word in words:
-            word = word.strip('.,!?')
             if (word in self._positive_keywords or 
                 word in self._negative_keywords or 
                 word in self._neutral_keywords):
-                phrases.append(word)
+                phrases[word] = None
         
         # Extract common financial phrases
         financial_phrases = [
@@ -159,9 +202,9 @@ class FinancialSentimentAnalyzer(ISentimentAnalyzer):
         
         for phrase in financial_phrases:
             if phrase in text:
-                phrases.append(phrase)
+                phrases[phrase] = None
         
-        return list(set(phrases))  # Remove duplicates
+        return list(phrases)  # Already de-duplicated, first-seen order
     
     def _calculate_positive_score(self, text: str) -> float:
         """Calculate positive sentiment score"""
@@ -169,7 +212,6 @@ class FinancialSentimentAnalyzer(ISentimentAnalyzer):
         score = 0.0
         
         for word in words:
-            word = word.strip('.,!?')
             if word in self._positive_keywords:
                 score += 1.0
         
@@ -185,7 +227,6 @@ class FinancialSentimentAnalyzer(ISentimentAnalyzer):
         score = 0.0
         
         for word in words:
-            word = word.strip('.,!?')
             if word in self._negative_keywords:
                 score += 1.0
         
@@ -201,7 +242,6 @@ class FinancialSentimentAnalyzer(ISentimentAnalyzer):
         score = 0.0
         
         for word in words:
-            word = word.strip('.,!?')
             if word in self._neutral_keywords:
                 score += 1.0
         
@@ -209,36 +249,27 @@ class FinancialSentimentAnalyzer(ISentimentAnalyzer):
     
     def _calculate_confidence(self, pos_prob: float, neg_prob: float, neut_prob: float) -> float:
         """Calculate confidence score based on probability distribution"""
-        # Higher confidence when one sentiment clearly dominates
-        max_prob = max(pos_prob, neg_prob, neut_prob)
-        
         # Calculate entropy (lower entropy = higher confidence)
-        import math
-        probs = [p for p in [pos_prob, neg_prob, neut_prob] if p > 0]
-        entropy = -sum(p * math.log(p) for p in probs) if probs else 0
-        max_entropy = math.log(3)  # Maximum entropy for 3 categories
+        entropy = 0.0
+        if pos_prob > 0:
+            entropy -= pos_prob * math.log(pos_prob)
+        if neg_prob > 0:
+            entropy -= neg_prob * math.log(neg_prob)
+        if neut_prob > 0:
+            entropy -= neut_prob * math.log(neut_prob)
         
         # Convert entropy to confidence (0 = low confidence, 1 = high confidence)
-        confidence = 1 - (entropy / max_entropy) if max_entropy > 0 else 0
+        confidence = 1.0 - entropy * _INV_LOG3
         
-        # Boost confidence if dominant sentiment is strong
-        if max_prob > 0.6:
+        # Boost confidence if dominant sentiment clearly dominates
+        if max(pos_prob, neg_prob, neut_prob) > 0.6:
             confidence *= 1.2
         
         return min(confidence, 1.0)
     
     def _determine_sentiment_type(self, score: float) -> SentimentType:
         """Determine sentiment type from score"""
-        if score <= -0.6:
-            return SentimentType.VERY_NEGATIVE
-        elif score <= -0.2:
-            return SentimentType.NEGATIVE
-        elif score <= 0.2:
-            return SentimentType.NEUTRAL
-        elif score <= 0.6:
-            return SentimentType.POSITIVE
-        else:
-            return SentimentType.VERY_POSITIVE
+        return _SENTIMENT_TYPES[bisect_left(_SENTIMENT_THRESHOLDS, score)]
 
 class SentimentAnalysisService:
     """
@@ -267,6 +298,44 @@ class SentimentAnalysisService:
         title_sentiment = self._analyzer.analyze_text(news.title)
         content_sentiment = self._analyzer.analyze_text(news.content)
         
+        return self._build_news_result(news, title_sentiment, content_sentiment, datetime.now())
+    
+    def analyze_news_batch(self, news_list: List[FinancialNews]) -> List[AnalysisResult]:
+        """
+        Perform sentiment analysis on several news articles at once
+        
+        All titles and contents go through a single analyze_batch call and
+        the results share one creation timestamp.
+        
+        Args:
+            news_list: Financial news articles to analyze
+            
+        Returns:
+            One analysis result per article, in input order
+        """
+        if not news_list:
+            return []
+        
+        texts = []
+        for news in news_list:
+            texts.append(news.title)
+            texts.append(news.content)
+        
+        scores = self._analyzer.analyze_batch(texts)
+        now = datetime.now()
+        
+        return [
+            self._build_news_result(news, scores[2 * i], scores[2 * i + 1], now)
+            for i, news in enumerate(news_list)
+        ]
+    
+    def _build_news_result(self, news: FinancialNews, title_sentiment: SentimentScore,
+                           content_sentiment: SentimentScore, now: datetime) -> AnalysisResult:
+        """Combine title/content sentiment into a complete analysis result"""
+        # Bind per-article values once; they are reused below
+        category = news.category.value
+        source = news.source.value
+        
         # Combine sentiments (title weighted more heavily)
         combined_score = (title_sentiment.score * 0.4) + (content_sentiment.score * 0.6)
         combined_confidence = (title_sentiment.confidence + content_sentiment.confidence) / 2
@@ -280,7 +349,7 @@ class SentimentAnalysisService:
             negative_probability=(title_sentiment.negative_probability + content_sentiment.negative_probability) / 2,
             neutral_probability=(title_sentiment.neutral_probability + content_sentiment.neutral_probability) / 2,
             analyzed_text_length=len(news.title) + len(news.content),
-            key_phrases=list(set((title_sentiment.key_phrases or []) + (content_sentiment.key_phrases or [])))
+            key_phrases=tuple(dict.fromkeys((title_sentiment.key_phrases or ()) + (content_sentiment.key_phrases or ())))
         )
         
         # Generate insights
@@ -297,7 +366,7 @@ class SentimentAnalysisService:
         
         # Create analysis result
         result = AnalysisResult(
-            id=f"sentiment_{news.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            id=f"sentiment_{news.id}_{next(_result_ids)}",
             analysis_type=AnalysisType.SENTIMENT_ANALYSIS,
             subject_id=news.id,
             sentiment_score=combined_sentiment,
@@ -308,10 +377,10 @@ class SentimentAnalysisService:
             recommendations=recommendations,
             risk_level=risk_level,
             analysis_method="Financial Sentiment Analysis",
-            data_sources=[news.source.value],
-            created_at=datetime.now(),
+            data_sources=[source],
+            created_at=now,
             analyst="AI_Sentiment_Analyzer",
-            metadata={"news_category": news.category.value}
+            metadata={"news_category": category}
         )
         
         return result
@@ -361,23 +430,10 @@ class SentimentAnalysisService:
         impact = abs(sentiment.score) * sentiment.confidence
         
         # Boost impact for certain categories
-        category_multipliers = {
-            "earnings": 1.2,
-            "economic_indicators": 1.3,
-            "regulatory": 1.1,
-            "market_analysis": 1.0
-        }
-        
-        multiplier = category_multipliers.get(news.category.value, 1.0)
+        multiplier = _CATEGORY_MULTIPLIERS[news.category]
         
         # Boost for high-profile sources
-        source_multipliers = {
-            "bloomberg": 1.1,
-            "reuters": 1.1,
-            "wall_street_journal": 1.05
-        }
-        
-        source_multiplier = source_multipliers.get(news.source.value, 1.0)
+        source_multiplier = _SOURCE_MULTIPLIERS[news.source]
         
         return min(impact * multiplier * source_multiplier, 1.0)
     
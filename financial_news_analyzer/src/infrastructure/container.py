@@ -2,7 +2,7 @@
 Dependency Injection Container
 Manages application dependencies and services
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 import logging
 
 from ..domain.services.sentiment_analysis_service import SentimentAnalysisService
@@ -15,52 +15,34 @@ class Container:
     Simple dependency injection container
     
     Design Patterns:
-    - Singleton Pattern: Single instance of container
-    - Factory Pattern: Creates service instances
+    - Factory Pattern: Services are built once by _build_container()
     - Service Locator Pattern: Centralized service access
-    """
     
-    _instance: Optional['Container'] = None
-    _services: Dict[str, Any] = {}
-    _initialized: bool = False
+    Services are stored in fixed slots; hot-path callers can use direct
+    attribute access (e.g. ``container.news_repository``).
+    """
     
-    def __new__(cls):
-        """Ensure singleton instance"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    SERVICE_NAMES = (
+        'sentiment_service',
+        'news_analysis_service',
+        'market_analysis_service',
+        'news_repository',
+        'market_repository',
+        'get_news_use_case',
+    )
     
-    def __init__(self):
-        """Initialize container if not already done"""
-        if not self._initialized:
-            self._initialize_services()
-            self._initialized = True
+    __slots__ = SERVICE_NAMES
     
-    def _initialize_services(self):
-        """Initialize all application services"""
-        try:
-            # Initialize core services
-            self._services['sentiment_service'] = SentimentAnalysisService()
-            self._services['news_analysis_service'] = NewsAnalysisService()
-            self._services['market_analysis_service'] = MarketAnalysisService()
-            
-            # Initialize repositories (would be real implementations in production)
-            from .repositories.in_memory_news_repository import InMemoryNewsRepository
-            from .repositories.in_memory_market_repository import InMemoryMarketRepository
-            
-            self._services['news_repository'] = InMemoryNewsRepository()
-            self._services['market_repository'] = InMemoryMarketRepository()
-            
-            # Initialize use cases
-            self._services['get_news_use_case'] = GetFinancialNewsUseCase(
-                self._services['news_repository']
-            )
-            
-            logging.info("Container initialized successfully")
-            
-        except Exception as e:
-            logging.error(f"Failed to initialize container: {e}")
-            raise
+    def __init__(self, sentiment_service: Any, news_analysis_service: Any,
+                 market_analysis_service: Any, news_repository: Any,
+                 market_repository: Any, get_news_use_case: Any):
+        """Store prebuilt service instances"""
+        self.sentiment_service = sentiment_service
+        self.news_analysis_service = news_analysis_service
+        self.market_analysis_service = market_analysis_service
+        self.news_repository = news_repository
+        self.market_repository = market_repository
+        self.get_news_use_case = get_news_use_case
     
     def get_service(self, service_name: str) -> Any:
         """
@@ -75,10 +57,10 @@ class Container:
         Raises:
             KeyError: If service not found
         """
-        if service_name not in self._services:
+        if service_name not in self.SERVICE_NAMES or not hasattr(self, service_name):
             raise KeyError(f"Service '{service_name}' not found in container")
         
-        return self._services[service_name]
+        return getattr(self, service_name)
     
     def register_service(self, service_name: str, service_instance: Any):
         """
@@ -87,27 +69,38 @@ class Container:
         Args:
             service_name: Name to register service under
             service_instance: Service instance to register
+            
+        Raises:
+            KeyError: If service_name is not one of SERVICE_NAMES
         """
-        self._services[service_name] = service_instance
+        if service_name not in self.SERVICE_NAMES:
+            raise KeyError(f"Service '{service_name}' is not a known container slot")
+        
+        setattr(self, service_name, service_instance)
         logging.info(f"Service '{service_name}' registered")
     
     def is_available(self, service_name: str) -> bool:
         """Check if service is available"""
-        return service_name in self._services
+        return service_name in self.SERVICE_NAMES and hasattr(self, service_name)
     
     def get_all_services(self) -> Dict[str, Any]:
         """Get all registered services"""
-        return self._services.copy()
+        return {
+            name: getattr(self, name)
+            for name in self.SERVICE_NAMES
+            if hasattr(self, name)
+        }
     
     def health_check(self) -> Dict[str, Any]:
         """Perform health check on all services"""
+        services = self.get_all_services()
         health_status = {
             "container_status": "healthy",
-            "services_count": len(self._services),
+            "services_count": len(services),
             "services": {}
         }
         
-        for service_name, service in self._services.items():
+        for service_name, service in services.items():
             try:
                 # Basic health check - just verify service exists and is not None
                 if service is not None:
@@ -121,5 +114,31 @@ class Container:
         
         return health_status
 
+def _build_container() -> Container:
+    """Build all application services once, at import time"""
+    try:
+        # Initialize repositories (would be real implementations in production)
+        from .repositories.in_memory_news_repository import InMemoryNewsRepository
+        from .repositories.in_memory_market_repository import InMemoryMarketRepository
+        
+        news_repository = InMemoryNewsRepository.with_samples()
+        sentiment_service = SentimentAnalysisService()
+        
+        built = Container(
+            sentiment_service=sentiment_service,
+            news_analysis_service=NewsAnalysisService(sentiment_service=sentiment_service),
+            market_analysis_service=MarketAnalysisService(),
+            news_repository=news_repository,
+            market_repository=InMemoryMarketRepository.with_samples(),
+            get_news_use_case=GetFinancialNewsUseCase(news_repository)
+        )
+        
+        logging.info("Container initialized successfully")
+        return built
+        
+    except Exception as e:
+        logging.error(f"Failed to initialize container: {e}")
+        raise
+
 # Global container instance
-container = Container()
+container = _build_container()
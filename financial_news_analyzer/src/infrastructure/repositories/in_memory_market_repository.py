@@ -2,28 +2,40 @@
 In-Memory Market Data Repository Implementation
 For development and testing purposes
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
-import random
+from types import MappingProxyType
+import copy
+import itertools
+
+import numpy as np
 
 from domain.repositories.market_data_repository import IMarketDataRepository
 from domain.entities.market_data import MarketData, Stock, MarketMetrics, MarketType, Currency
 
-class InMemoryMarketRepository(IMarketDataRepository):
-    """
-    In-memory implementation of market data repository
-    Useful for development, testing, and demos
-    """
-    
-    def __init__(self):
-        """Initialize with sample market data"""
-        self._stocks_storage: Dict[str, Stock] = {}
-        self._initialize_sample_data()
-    
-    def _initialize_sample_data(self):
-        """Initialize with sample stock data for demo purposes"""
-        sample_stocks = [
+# Mock sector data
+_SECTOR_PERFORMANCE = MappingProxyType({
+    "Technology": 2.3,
+    "Healthcare": 1.1,
+    "Financial": -0.5,
+    "Energy": -1.2,
+    "Consumer": 0.8,
+    "Industrial": 0.3,
+    "Materials": -0.2,
+    "Utilities": 0.1,
+    "Real Estate": -0.8,
+    "Telecommunications": 0.5
+})
+
+# Sample stocks for with_samples(), built on first use
+_SAMPLE_STOCKS: Optional[Tuple[Stock, ...]] = None
+
+def _sample_stocks() -> Tuple[Stock, ...]:
+    """Build the sample stock data once and reuse it for every repository"""
+    global _SAMPLE_STOCKS
+    if _SAMPLE_STOCKS is None:
+        _SAMPLE_STOCKS = (
             Stock(
                 symbol="AAPL",
                 name="Apple Inc.",
@@ -53,32 +65,162 @@ class InMemoryMarketRepository(IMarketDataRepository):
                 market_cap=Decimal("3100000000000")
             ),
             # Add more sample stocks...
-        ]
+        )
+    return _SAMPLE_STOCKS
+
+# Major market indices (mock). Rows are immutable Stock constructor arguments, parsed once
+# at import; get_market_indices builds fresh Stocks from them on every call.
+_MARKET_INDEX_ROWS = (
+    MappingProxyType({
+        "symbol": "SPY",
+        "name": "SPDR S&P 500 ETF",
+        "exchange": "NYSE",
+        "current_price": Decimal("445.20"),
+        "currency": Currency.USD,
+        "previous_close": Decimal("443.80"),
+        "volume": 75000000
+    }),
+    MappingProxyType({
+        "symbol": "QQQ",
+        "name": "Invesco QQQ ETF",
+        "exchange": "NASDAQ",
+        "current_price": Decimal("378.50"),
+        "currency": Currency.USD,
+        "previous_close": Decimal("376.20"),
+        "volume": 45000000
+    })
+)
+
+class InMemoryMarketRepository(IMarketDataRepository):
+    """
+    In-memory implementation of market data repository
+    Useful for development, testing, and demos
+    
+    Aggregates and rankings read from NumPy columns (structure of arrays)
+    mirroring _stocks_storage in insertion order. The columns are rebuilt
+    lazily after any write that marks them dirty.
+    
+    search_stocks uses lowercase symbol/name terms computed once per write
+    and a 3-gram index over them to narrow candidates.
+    """
+    
+    def __init__(self):
+        """Initialize with empty market storage; see with_samples() for demo data"""
+        self._stocks_storage: Dict[str, Stock] = {}
+        self._dirty = True
         
-        for stock in sample_stocks:
-            self._stocks_storage[stock.symbol] = stock
+        # Search index: symbol -> (symbol_lower, name_lower), storage position, 3-gram -> symbols
+        self._search_terms: Dict[str, Tuple[str, str]] = {}
+        self._search_positions: Dict[str, int] = {}
+        self._trigram_index: Dict[str, Set[str]] = {}
+        
+        # Plain float/bool shadows of each stock's metrics, taken once on write so
+        # aggregation never touches Decimal arithmetic:
+        # (change_percent, has_change, volume, has_volume, is_gaining, is_losing)
+        self._stock_metrics: Dict[str, Tuple[float, bool, int, bool, bool, bool]] = {}
+    
+    @staticmethod
+    def _trigrams(terms) -> Set[str]:
+        """All 3-character substrings of the given terms"""
+        return {term[i:i + 3] for term in terms for i in range(len(term) - 2)}
+    
+    def _store(self, stock: Stock):
+        """Store a stock and refresh its search terms and metric shadows"""
+        self._stocks_storage[stock.symbol] = stock
+        self._stock_metrics[stock.symbol] = (
+            float(stock.change_percent or 0.0),
+            stock.change_percent is not None,
+            stock.volume or 0,
+            stock.volume is not None,
+            stock.is_gaining,
+            stock.is_losing
+        )
+        
+        previous = self._search_terms.get(stock.symbol)
+        if previous is None:
+            self._search_positions[stock.symbol] = len(self._search_positions)
+        else:
+            for gram in self._trigrams(previous):
+                self._trigram_index[gram].discard(stock.symbol)
+        
+        terms = (stock.symbol.lower(), stock.name.lower())
+        self._search_terms[stock.symbol] = terms
+        for gram in self._trigrams(terms):
+            self._trigram_index.setdefault(gram, set()).add(stock.symbol)
+    
+    def _rebuild_columns(self):
+        """Rebuild the NumPy column cache from the metric shadows"""
+        rows = list(self._stock_metrics.values())
+        count = len(rows)
+        
+        self._stock_list = list(self._stocks_storage.values())
+        self._change = np.fromiter((r[0] for r in rows), dtype=np.float64, count=count)
+        self._has_change = np.fromiter((r[1] for r in rows), dtype=bool, count=count)
+        self._volume = np.fromiter((r[2] for r in rows), dtype=np.int64, count=count)
+        self._has_volume = np.fromiter((r[3] for r in rows), dtype=bool, count=count)
+        self._gaining = np.fromiter((r[4] for r in rows), dtype=bool, count=count)
+        self._losing = np.fromiter((r[5] for r in rows), dtype=bool, count=count)
+        self._movers_cache = None
+        self._dirty = False
+    
+    def _columns(self):
+        """Make sure the column cache reflects the current storage"""
+        if self._dirty:
+            self._rebuild_columns()
+    
+    def _summarize(self, count: int):
+        """Gaining/losing counts, average change and total volume of the first count stocks"""
+        changes = self._change[:count][self._has_change[:count]]
+        return (
+            int(self._gaining[:count].sum()),
+            int(self._losing[:count].sum()),
+            float(changes.mean()) if changes.size else 0.0,
+            int(self._volume[:count].sum())
+        )
+    
+    def _top_by(self, values: np.ndarray, mask: np.ndarray, limit: int, descending: bool) -> List[Stock]:
+        """Stocks with the limit highest/lowest values, ties kept in storage order"""
+        candidates = np.flatnonzero(mask)
+        if limit <= 0 or candidates.size == 0:
+            return []
+        
+        keys = -values[candidates] if descending else values[candidates]
+        if limit < candidates.size:
+            # Partition to find the cut-off, then fully sort only what survives.
+            # Everything tied with the cut-off is kept so ties stay in storage order
+            threshold = np.partition(keys, limit - 1)[limit - 1]
+            kept = keys <= threshold
+            candidates, keys = candidates[kept], keys[kept]
+        
+        order = candidates[np.argsort(keys, kind='stable')]
+        return [self._stock_list[i] for i in order[:limit]]
+    
+    @classmethod
+    def with_samples(cls) -> 'InMemoryMarketRepository':
+        """Create a repository pre-loaded with sample stock data for demo purposes"""
+        repository = cls()
+        for stock in _sample_stocks():
+            # Shallow copy keeps instances isolated without re-parsing Decimals
+            sample = copy.copy(stock)
+            sample.metadata = dict(stock.metadata)
+            repository._store(sample)
+        repository._dirty = True
+        return repository
     
     def get_market_data(self, market_type: MarketType, limit: int = 100) -> Optional[MarketData]:
         """Get current market data"""
         try:
-            stocks = list(self._stocks_storage.values())[:limit]
+            self._columns()
+            stocks = self._stock_list[:limit]
             
             if not stocks:
                 return None
             
             # Calculate metrics
             total_stocks = len(stocks)
-            gaining_stocks = sum(1 for s in stocks if s.is_gaining)
-            losing_stocks = sum(1 for s in stocks if s.is_losing)
+            gaining_stocks, losing_stocks, avg_change, total_volume = self._summarize(total_stocks)
             unchanged_stocks = total_stocks - gaining_stocks - losing_stocks
             
-            # Calculate averages
-            changes = [s.change_percent for s in stocks if s.change_percent is not None]
-            avg_change = sum(changes) / len(changes) if changes else 0.0
-            
-            volumes = [s.volume for s in stocks if s.volume is not None]
-            total_volume = sum(volumes) if volumes else 0
-            
             metrics = MarketMetrics(
                 total_stocks=total_stocks,
                 gaining_stocks=gaining_stocks,
@@ -107,62 +249,88 @@ class InMemoryMarketRepository(IMarketDataRepository):
     
     def get_stocks_by_exchange(self, exchange: str, limit: int = 100) -> List[Stock]:
         """Get stocks by exchange"""
-        results = [stock for stock in self._stocks_storage.values() 
-                  if stock.exchange.upper() == exchange.upper()]
-        return results[:limit]
+        exchange_upper = exchange.upper()
+        matches = (stock for stock in self._stocks_storage.values()
+                   if stock.exchange.upper() == exchange_upper)
+        return list(itertools.islice(matches, max(limit, 0)))
     
     def get_top_gainers(self, limit: int = 10) -> List[Stock]:
         """Get top gaining stocks"""
-        stocks_with_change = [s for s in self._stocks_storage.values() 
-                             if s.change_percent is not None]
-        
-        stocks_with_change.sort(key=lambda x: x.change_percent, reverse=True)
-        return stocks_with_change[:limit]
+        return self.get_top_movers(limit)[0]
     
     def get_top_losers(self, limit: int = 10) -> List[Stock]:
         """Get top losing stocks"""
-        stocks_with_change = [s for s in self._stocks_storage.values() 
-                             if s.change_percent is not None]
+        return self.get_top_movers(limit)[1]
+    
+    def get_top_movers(self, limit: int = 10) -> Tuple[List[Stock], List[Stock]]:
+        """
+        Get top gainers and top losers together
+        
+        Both ends are cut with a single partition of the change column, and the
+        result is reused until the next write, so dashboards asking for gainers
+        and losers back to back only pay once.
+        """
+        self._columns()
+        if self._movers_cache is None or self._movers_cache[0] != limit:
+            self._movers_cache = (limit, self._compute_top_movers(limit))
         
-        stocks_with_change.sort(key=lambda x: x.change_percent)
-        return stocks_with_change[:limit]
+        gainers, losers = self._movers_cache[1]
+        return list(gainers), list(losers)
+    
+    def _compute_top_movers(self, limit: int) -> Tuple[List[Stock], List[Stock]]:
+        """Top limit gainers and losers, ties kept in storage order"""
+        candidates = np.flatnonzero(self._has_change)
+        if limit <= 0 or candidates.size == 0:
+            return [], []
+        
+        keys = self._change[candidates]
+        count = candidates.size
+        if 2 * limit < count:
+            # One partition locates both cut-offs; keep everything at or beyond them
+            cut = np.partition(keys, (limit - 1, count - limit))
+            kept = (keys <= cut[limit - 1]) | (keys >= cut[count - limit])
+            candidates, keys = candidates[kept], keys[kept]
+        
+        gainers = candidates[np.argsort(-keys, kind='stable')][:limit]
+        losers = candidates[np.argsort(keys, kind='stable')][:limit]
+        return [self._stock_list[i] for i in gainers], [self._stock_list[i] for i in losers]
     
     def get_most_active(self, limit: int = 10) -> List[Stock]:
         """Get most active stocks by volume"""
-        stocks_with_volume = [s for s in self._stocks_storage.values() 
-                             if s.volume is not None]
-        
-        stocks_with_volume.sort(key=lambda x: x.volume, reverse=True)
-        return stocks_with_volume[:limit]
+        self._columns()
+        return self._top_by(self._volume, self._has_volume, limit, descending=True)
     
     def search_stocks(self, query: str, limit: int = 20) -> List[Stock]:
         """Search stocks by name or symbol"""
         query_lower = query.lower()
-        results = []
         
-        for stock in self._stocks_storage.values():
-            if (query_lower in stock.symbol.lower() or 
-                query_lower in stock.name.lower()):
-                results.append(stock)
+        if len(query_lower) < 3:
+            candidates = self._search_terms
+        else:
+            # Every 3-gram of the query must occur in the stock's terms
+            gram_sets = [self._trigram_index.get(gram, set()) for gram in self._trigrams((query_lower,))]
+            gram_sets.sort(key=len)
+            candidates = sorted(gram_sets[0].intersection(*gram_sets[1:]), key=self._search_positions.__getitem__)
+        
+        results = []
+        for symbol in candidates:
+            if len(results) >= limit:
+                break
+            symbol_lower, name_lower = self._search_terms[symbol]
+            if query_lower in symbol_lower or query_lower in name_lower:
+                results.append(self._stocks_storage[symbol])
         
-        return results[:limit]
+        return results
     
     def get_market_overview(self) -> Dict[str, Any]:
         """Get overall market overview"""
-        stocks = list(self._stocks_storage.values())
+        self._columns()
+        total = len(self._stock_list)
         
-        if not stocks:
+        if not total:
             return {"message": "No market data available"}
         
-        gaining = sum(1 for s in stocks if s.is_gaining)
-        losing = sum(1 for s in stocks if s.is_losing)
-        total = len(stocks)
-        
-        changes = [s.change_percent for s in stocks if s.change_percent is not None]
-        avg_change = sum(changes) / len(changes) if changes else 0.0
-        
-        volumes = [s.volume for s in stocks if s.volume is not None]
-        total_volume = sum(volumes) if volumes else 0
+        gaining, losing, avg_change, total_volume = self._summarize(total)
         
         return {
             "total_stocks": total,
@@ -177,49 +345,18 @@ class InMemoryMarketRepository(IMarketDataRepository):
     
     def get_sector_performance(self) -> Dict[str, float]:
         """Get performance by sector"""
-        # Mock sector data
-        return {
-            "Technology": 2.3,
-            "Healthcare": 1.1,
-            "Financial": -0.5,
-            "Energy": -1.2,
-            "Consumer": 0.8,
-            "Industrial": 0.3,
-            "Materials": -0.2,
-            "Utilities": 0.1,
-            "Real Estate": -0.8,
-            "Telecommunications": 0.5
-        }
+        return dict(_SECTOR_PERFORMANCE)
     
     def get_market_indices(self) -> List[Stock]:
         """Get major market indices"""
-        indices = [
-            Stock(
-                symbol="SPY",
-                name="SPDR S&P 500 ETF",
-                exchange="NYSE",
-                current_price=Decimal("445.20"),
-                currency=Currency.USD,
-                previous_close=Decimal("443.80"),
-                volume=75000000
-            ),
-            Stock(
-                symbol="QQQ",
-                name="Invesco QQQ ETF",
-                exchange="NASDAQ",
-                current_price=Decimal("378.50"),
-                currency=Currency.USD,
-                previous_close=Decimal("376.20"),
-                volume=45000000
-            )
-        ]
-        return indices
+        return [Stock(**row) for row in _MARKET_INDEX_ROWS]
     
     def save_market_data(self, market_data: MarketData) -> bool:
         """Save market data snapshot"""
         try:
             for stock in market_data.stocks:
-                self._stocks_storage[stock.symbol] = stock
+                self._store(stock)
+            self._dirty = True
             return True
         except Exception:
             return False
@@ -228,32 +365,34 @@ class InMemoryMarketRepository(IMarketDataRepository):
         """Get historical data for a symbol"""
         stock = self.get_stock_by_symbol(symbol)
         
-        if not stock:
+        if not stock or days_back <= 0:
             return []
         
-        # Generate mock historical data
-        historical_data = []
-        base_price = float(stock.current_price)
-        
-        for i in range(days_back, 0, -1):
-            date = datetime.now() - timedelta(days=i)
-            
-            # Simulate price movements
-            change_pct = random.uniform(-0.05, 0.05)  # ±5% daily change
-            price = base_price * (1 + change_pct)
-            
-            historical_data.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "open": round(price * 0.998, 2),
-                "high": round(price * 1.015, 2),
-                "low": round(price * 0.985, 2),
-                "close": round(price, 2),
-                "volume": random.randint(1000000, 50000000)
-            })
-            
-            base_price = price  # Use as base for next day
+        # Generate mock historical data: a random walk of ±5% daily changes
+        rng = np.random.default_rng()
+        prices = float(stock.current_price) * np.cumprod(1.0 + rng.uniform(-0.05, 0.05, days_back))
+        volumes = rng.integers(1000000, 50000001, size=days_back)
+        now = datetime.now()
+        dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days_back, 0, -1)]
         
-        return historical_data
+        return [
+            {
+                "date": date,
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume
+            }
+            for date, open_, high, low, close, volume in zip(
+                dates,
+                np.round(prices * 0.998, 2).tolist(),
+                np.round(prices * 1.015, 2).tolist(),
+                np.round(prices * 0.985, 2).tolist(),
+                np.round(prices, 2).tolist(),
+                volumes.tolist()
+            )
+        ]
     
     def get_market_status(self) -> Dict[str, Any]:
         """Get current market status information"""
@@ -2,26 +2,67 @@
 In-Memory News Repository Implementation
 For development and testing purposes
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from operator import itemgetter
+import heapq
 import uuid
 
 from domain.repositories.news_repository import INewsRepository
 from domain.entities.financial_news import FinancialNews, NewsCategory, NewsSource
 
+def _epoch_ns(moment: datetime) -> int:
+    """Exact integer epoch-nanoseconds for a datetime, used as the time index key"""
+    return int(moment.replace(microsecond=0).timestamp()) * 1_000_000_000 + moment.microsecond * 1000
+
 class InMemoryNewsRepository(INewsRepository):
     """
     In-memory implementation of news repository
     Useful for development, testing, and demos
+    
+    Articles are indexed on write: exact-match filters (category, source,
+    symbol, keyword) map to id sets, and range filters (published_at,
+    sentiment, impact) use (value, id) lists kept sorted with bisect.
+    Publication times are keyed as integer epoch-nanoseconds so index
+    comparisons are plain int compares rather than datetime compares.
     """
     
     def __init__(self):
-        """Initialize with empty news storage"""
+        """Initialize with empty news storage; see with_samples() for demo data"""
         self._news_storage: Dict[str, FinancialNews] = {}
-        self._initialize_sample_data()
+        
+        # Inverted indexes: value -> ids
+        self._by_category: Dict[NewsCategory, Set[str]] = {}
+        self._by_source: Dict[NewsSource, Set[str]] = {}
+        self._by_symbol: Dict[str, Set[str]] = {}
+        self._by_keyword: Dict[str, Set[str]] = {}
+        
+        # Sorted (value, id) indexes for range filters
+        self._by_time: List[Tuple[int, str]] = []
+        self._by_sentiment: List[Tuple[float, str]] = []
+        self._by_impact: List[Tuple[float, str]] = []
+        
+        # Per-category/source/symbol (published_ns, id) lists for newest-first lookups
+        self._category_timeline: Dict[NewsCategory, List[Tuple[int, str]]] = {}
+        self._source_timeline: Dict[NewsSource, List[Tuple[int, str]]] = {}
+        self._symbol_timeline: Dict[str, List[Tuple[int, str]]] = {}
+        
+        # Index keys as they were at write time, so stale entries can be removed
+        # even if the caller mutated the article afterwards
+        self._indexed: Dict[str, Tuple] = {}
+        
+        # Running statistics, maintained alongside the indexes
+        self._category_counts: Counter = Counter()
+        self._source_counts: Counter = Counter()
+        self._sentiment_sum = 0.0
+        self._impact_sum = 0.0
     
-    def _initialize_sample_data(self):
-        """Initialize with sample news data for demo purposes"""
+    @classmethod
+    def with_samples(cls) -> 'InMemoryNewsRepository':
+        """Create a repository pre-loaded with sample news data for demo purposes"""
+        repository = cls()
         sample_news = [
             FinancialNews(
                 id=str(uuid.uuid4()),
@@ -55,14 +96,103 @@ class InMemoryNewsRepository(INewsRepository):
         ]
         
         for news in sample_news:
-            self._news_storage[news.id] = news
+            repository.save(news)
+        return repository
+    
+    def _index(self, news: FinancialNews):
+        """Add an article to all indexes"""
+        symbols = frozenset(symbol.upper() for symbol in news.mentioned_symbols or ())
+        keywords = frozenset(keyword.lower() for keyword in news.keywords or ())
+        published_ns = _epoch_ns(news.published_at)
+        keys = (published_ns, news.category, news.source, symbols, keywords,
+                news.sentiment_score, news.impact_score)
+        self._indexed[news.id] = keys
+        
+        self._by_category.setdefault(news.category, set()).add(news.id)
+        self._by_source.setdefault(news.source, set()).add(news.id)
+        insort(self._category_timeline.setdefault(news.category, []), (published_ns, news.id))
+        insort(self._source_timeline.setdefault(news.source, []), (published_ns, news.id))
+        for symbol in symbols:
+            self._by_symbol.setdefault(symbol, set()).add(news.id)
+            insort(self._symbol_timeline.setdefault(symbol, []), (published_ns, news.id))
+        for keyword in keywords:
+            self._by_keyword.setdefault(keyword, set()).add(news.id)
+        
+        insort(self._by_time, (published_ns, news.id))
+        if news.sentiment_score is not None:
+            insort(self._by_sentiment, (news.sentiment_score, news.id))
+            self._sentiment_sum += news.sentiment_score
+        if news.impact_score is not None:
+            insort(self._by_impact, (news.impact_score, news.id))
+            self._impact_sum += news.impact_score
+        
+        self._category_counts[news.category.value] += 1
+        self._source_counts[news.source.value] += 1
+    
+    def _unindex(self, news_id: str):
+        """Remove an article from all indexes using the keys it was indexed with"""
+        keys = self._indexed.pop(news_id, None)
+        if keys is None:
+            return
+        published_ns, category, source, symbols, keywords, sentiment, impact = keys
+        
+        self._by_category[category].discard(news_id)
+        self._by_source[source].discard(news_id)
+        self._remove_sorted(self._category_timeline[category], (published_ns, news_id))
+        self._remove_sorted(self._source_timeline[source], (published_ns, news_id))
+        for symbol in symbols:
+            self._by_symbol[symbol].discard(news_id)
+            self._remove_sorted(self._symbol_timeline[symbol], (published_ns, news_id))
+        for keyword in keywords:
+            self._by_keyword[keyword].discard(news_id)
+        
+        self._remove_sorted(self._by_time, (published_ns, news_id))
+        if sentiment is not None:
+            self._remove_sorted(self._by_sentiment, (sentiment, news_id))
+            self._sentiment_sum -= sentiment
+        if impact is not None:
+            self._remove_sorted(self._by_impact, (impact, news_id))
+            self._impact_sum -= impact
+        
+        self._category_counts[category.value] -= 1
+        self._source_counts[source.value] -= 1
+    
+    @staticmethod
+    def _remove_sorted(index: List[Tuple], entry: Tuple):
+        """Remove an entry from a sorted (value, id) index"""
+        position = bisect_left(index, entry)
+        if position < len(index) and index[position] == entry:
+            del index[position]
+    
+    def _newest(self, index: List[Tuple[Any, str]], limit: int, start: int = 0) -> List[FinancialNews]:
+        """Materialize the last limit articles of an ascending (value, id) index, highest first"""
+        return [self._news_storage[news_id]
+                for _, news_id in reversed(index[max(len(index) - limit, start, 0):])]
+    
+    @staticmethod
+    def _ids_for(index: Dict[Any, Set[str]], values) -> Set[str]:
+        """Union of the id sets for any of the given index values"""
+        ids: Set[str] = set()
+        for value in values:
+            ids |= index.get(value, set())
+        return ids
+    
+    @staticmethod
+    def _ids_in_range(index: List[Tuple], low, high) -> Set[str]:
+        """Ids whose indexed value lies in [low, high]; None leaves a side open"""
+        value = itemgetter(0)
+        start = bisect_left(index, low, key=value) if low is not None else 0
+        stop = bisect_right(index, high, key=value) if high is not None else len(index)
+        return {news_id for _, news_id in index[start:stop]}
     
     def save(self, news: FinancialNews) -> bool:
         """Save a news article"""
         try:
             if not news.id:
                 news.id = str(uuid.uuid4())
+            self._unindex(news.id)
             self._news_storage[news.id] = news
+            self._index(news)
             return True
         except Exception:
             return False
@@ -72,121 +202,94 @@ class InMemoryNewsRepository(INewsRepository):
         return self._news_storage.get(news_id)
     
     def find_by_criteria(self, criteria) -> List[FinancialNews]:
-        """Find news by search criteria"""
-        results = list(self._news_storage.values())
+        """Find news by search criteria, newest first (by published_at)"""
+        ordered = sorted(self._matching_ids(criteria),
+                         key=lambda news_id: self._indexed[news_id][0], reverse=True)
+        return [self._news_storage[news_id] for news_id in ordered]
+    
+    def _matching_ids(self, criteria):
+        """Ids of articles matching the criteria, resolved on the indexes alone"""
+        candidate_sets: List[Set[str]] = []
         
         # Apply time filters
-        if criteria.start_date:
-            results = [n for n in results if n.published_at >= criteria.start_date]
-        
-        if criteria.end_date:
-            results = [n for n in results if n.published_at <= criteria.end_date]
+        if criteria.start_date or criteria.end_date:
+            candidate_sets.append(self._ids_in_range(
+                self._by_time,
+                _epoch_ns(criteria.start_date) if criteria.start_date else None,
+                _epoch_ns(criteria.end_date) if criteria.end_date else None))
         
         # Apply content filters
         if criteria.categories:
-            results = [n for n in results if n.category in criteria.categories]
+            candidate_sets.append(self._ids_for(self._by_category, criteria.categories))
         
         if criteria.sources:
-            results = [n for n in results if n.source in criteria.sources]
+            candidate_sets.append(self._ids_for(self._by_source, criteria.sources))
         
         if criteria.symbols:
-            results = [n for n in results 
-                      if n.mentioned_symbols and 
-                      any(symbol in n.mentioned_symbols for symbol in criteria.symbols)]
+            candidate_sets.append(self._ids_for(
+                self._by_symbol, {symbol.upper() for symbol in criteria.symbols}))
         
         if criteria.keywords:
-            results = [n for n in results 
-                      if n.keywords and 
-                      any(keyword.lower() in [k.lower() for k in n.keywords] 
-                          for keyword in criteria.keywords)]
+            candidate_sets.append(self._ids_for(
+                self._by_keyword, {keyword.lower() for keyword in criteria.keywords}))
         
         # Apply sentiment filters
-        if criteria.min_sentiment_score is not None:
-            results = [n for n in results 
-                      if n.sentiment_score is not None and 
-                      n.sentiment_score >= criteria.min_sentiment_score]
-        
-        if criteria.max_sentiment_score is not None:
-            results = [n for n in results 
-                      if n.sentiment_score is not None and 
-                      n.sentiment_score <= criteria.max_sentiment_score]
+        if criteria.min_sentiment_score is not None or criteria.max_sentiment_score is not None:
+            candidate_sets.append(self._ids_in_range(
+                self._by_sentiment, criteria.min_sentiment_score, criteria.max_sentiment_score))
         
         # Apply impact filters
         if criteria.min_impact_score is not None:
-            results = [n for n in results 
-                      if n.impact_score is not None and 
-                      n.impact_score >= criteria.min_impact_score]
+            candidate_sets.append(self._ids_in_range(
+                self._by_impact, criteria.min_impact_score, None))
+        
+        if not candidate_sets:
+            return self._news_storage.keys()
         
-        return results
+        candidate_sets.sort(key=len)
+        return candidate_sets[0].intersection(*candidate_sets[1:])
     
     def find_by_symbol(self, symbol: str, limit: int = 50) -> List[FinancialNews]:
         """Find news mentioning specific stock symbol"""
-        results = []
-        symbol_upper = symbol.upper()
-        
-        for news in self._news_storage.values():
-            if (news.mentioned_symbols and 
-                symbol_upper in [s.upper() for s in news.mentioned_symbols]):
-                results.append(news)
-        
-        # Sort by published date (newest first)
-        results.sort(key=lambda x: x.published_at, reverse=True)
-        return results[:limit]
+        return self._newest(self._symbol_timeline.get(symbol.upper(), []), limit)
     
     def find_by_category(self, category: NewsCategory, limit: int = 50) -> List[FinancialNews]:
         """Find news by category"""
-        results = [news for news in self._news_storage.values() 
-                  if news.category == category]
-        
-        results.sort(key=lambda x: x.published_at, reverse=True)
-        return results[:limit]
+        return self._newest(self._category_timeline.get(category, []), limit)
     
     def find_by_source(self, source: NewsSource, limit: int = 50) -> List[FinancialNews]:
         """Find news by source"""
-        results = [news for news in self._news_storage.values() 
-                  if news.source == source]
-        
-        results.sort(key=lambda x: x.published_at, reverse=True)
-        return results[:limit]
+        return self._newest(self._source_timeline.get(source, []), limit)
     
     def find_recent(self, hours_back: int = 24, limit: int = 50) -> List[FinancialNews]:
         """Find recent news within specified time window"""
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
-        results = [news for news in self._news_storage.values() 
-                  if news.published_at >= cutoff_time]
-        
-        results.sort(key=lambda x: x.published_at, reverse=True)
-        return results[:limit]
+        cutoff_ns = _epoch_ns(datetime.now() - timedelta(hours=hours_back))
+        start = bisect_left(self._by_time, cutoff_ns, key=itemgetter(0))
+        return self._newest(self._by_time, limit, start)
     
     def find_by_sentiment_range(self, min_score: float, max_score: float, 
                                limit: int = 50) -> List[FinancialNews]:
         """Find news by sentiment score range"""
-        results = []
-        
-        for news in self._news_storage.values():
-            if (news.sentiment_score is not None and 
-                min_score <= news.sentiment_score <= max_score):
-                results.append(news)
+        value = itemgetter(0)
+        start = bisect_left(self._by_sentiment, min_score, key=value)
+        stop = bisect_right(self._by_sentiment, max_score, key=value)
         
-        results.sort(key=lambda x: x.published_at, reverse=True)
-        return results[:limit]
+        newest = heapq.nlargest(limit, self._by_sentiment[start:stop],
+                                key=lambda entry: self._indexed[entry[1]][0])
+        return [self._news_storage[news_id] for _, news_id in newest]
     
     def find_high_impact(self, min_impact: float = 0.7, limit: int = 50) -> List[FinancialNews]:
         """Find high-impact news articles"""
-        results = []
-        
-        for news in self._news_storage.values():
-            if news.impact_score is not None and news.impact_score >= min_impact:
-                results.append(news)
-        
-        results.sort(key=lambda x: x.impact_score or 0, reverse=True)
-        return results[:limit]
+        start = bisect_left(self._by_impact, min_impact, key=itemgetter(0))
+        return self._newest(self._by_impact, limit, start)
     
     def update(self, news: FinancialNews) -> bool:
         """Update existing news article"""
         try:
             if news.id in self._news_storage:
+                self._unindex(news.id)
                 self._news_storage[news.id] = news
+                self._index(news)
                 return True
             return False
         except Exception:
@@ -196,6 +299,7 @@ class InMemoryNewsRepository(INewsRepository):
         """Delete news article by ID"""
         try:
             if news_id in self._news_storage:
+                self._unindex(news_id)
                 del self._news_storage[news_id]
                 return True
             return False
@@ -204,8 +308,7 @@ class InMemoryNewsRepository(INewsRepository):
     
     def count_by_criteria(self, criteria) -> int:
         """Count news articles matching criteria"""
-        results = self.find_by_criteria(criteria)
-        return len(results)
+        return len(self._matching_ids(criteria))
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get repository statistics"""
@@ -214,43 +317,21 @@ class InMemoryNewsRepository(INewsRepository):
         if total_count == 0:
             return {"total_articles": 0}
         
-        # Calculate category distribution
-        category_counts = {}
-        source_counts = {}
-        sentiment_scores = []
-        impact_scores = []
-        
-        for news in self._news_storage.values():
-            # Categories
-            category = news.category.value
-            category_counts[category] = category_counts.get(category, 0) + 1
-            
-            # Sources
-            source = news.source.value
-            source_counts[source] = source_counts.get(source, 0) + 1
-            
-            # Sentiment scores
-            if news.sentiment_score is not None:
-                sentiment_scores.append(news.sentiment_score)
-            
-            # Impact scores
-            if news.impact_score is not None:
-                impact_scores.append(news.impact_score)
-        
         return {
             "total_articles": total_count,
-            "category_distribution": category_counts,
-            "source_distribution": source_counts,
-            "sentiment_stats": {
-                "count": len(sentiment_scores),
-                "average": sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0,
-                "min": min(sentiment_scores) if sentiment_scores else None,
-                "max": max(sentiment_scores) if sentiment_scores else None
-            },
-            "impact_stats": {
-                "count": len(impact_scores),
-                "average": sum(impact_scores) / len(impact_scores) if impact_scores else 0,
-                "min": min(impact_scores) if impact_scores else None,
-                "max": max(impact_scores) if impact_scores else None
-            }
+            "category_distribution": dict(+self._category_counts),
+            "source_distribution": dict(+self._source_counts),
+            "sentiment_stats": self._score_stats(self._by_sentiment, self._sentiment_sum),
+            "impact_stats": self._score_stats(self._by_impact, self._impact_sum)
+        }
+    
+    @staticmethod
+    def _score_stats(index: List[Tuple[float, str]], total: float) -> Dict[str, Any]:
+        """Count/average/min/max of a score, read from its sorted index and running sum"""
+        count = len(index)
+        return {
+            "count": count,
+            "average": total / count if count else 0,
+            "min": index[0][0] if count else None,
+            "max": index[-1][0] if count else None
         }
@@ -10,6 +10,5 @@ __all__ = [
     'mock_news_service',
     'MockNewsService',
     'mock_market_service',
-    'MockMarketService',
-    'FeedbackService'
+    'MockMarketService'
 ]
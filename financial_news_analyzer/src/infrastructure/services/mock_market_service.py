@@ -3,181 +3,285 @@ Mock Market Service
 Provides sample market data for development and testing
 """
 
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-import random
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+from datetime import datetime, date
+from functools import lru_cache
 import math
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# Annotation only: this module is also loaded with src/ as the import root, where a
+# package-relative import of the domain layer would fail
+if TYPE_CHECKING:
+    from ...domain.entities.market_data import StockQuote
+
+HISTORICAL_COLUMNS = ['symbol', 'date', 'open', 'high', 'low', 'close', 'volume', 'adjusted_close']
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'adjusted_close']
+
+PERIOD_DAYS = {
+    "1D": 1, "5D": 5, "1M": 30, "3M": 90, 
+    "6M": 180, "1Y": 365, "2Y": 730, "5Y": 1825
+}
+HISTORY_DAYS = max(PERIOD_DAYS.values())
+
+# (symbol, name, base value) for each major index
+MARKET_INDICES = (
+    ('^GSPC', 'S&P 500', 4500),
+    ('^DJI', 'Dow Jones Industrial Average', 35000),
+    ('^IXIC', 'NASDAQ Composite', 14000),
+    ('^RUT', 'Russell 2000', 2000),
+    ('^VIX', 'CBOE Volatility Index', 20),
+)
+INDEX_BASE_VALUES = np.array([base for _, _, base in MARKET_INDICES], dtype=np.float64)
+VIX_POSITION = [symbol for symbol, _, _ in MARKET_INDICES].index('^VIX')
+
+SECTORS = (
+    'Technology', 'Healthcare', 'Financial Services', 'Consumer Discretionary',
+    'Communication Services', 'Industrials', 'Consumer Staples', 
+    'Energy', 'Utilities', 'Real Estate', 'Materials'
+)
+
+def _floored_walk(start: float, daily_returns: np.ndarray, floor: float) -> np.ndarray:
+    """
+    Compound daily returns from start, never letting the price drop below floor
+    
+    Same result as the step-by-step loop ``price = max(price * (1 + r), floor)``,
+    computed without a Python loop: in log space the floored walk is the free
+    walk lifted by the running maximum of how far it has fallen below the floor.
+    """
+    log_path = np.log(start) + np.cumsum(np.log1p(daily_returns))
+    shortfall = np.maximum.accumulate(np.log(floor) - log_path)
+    return np.maximum(np.exp(log_path + np.maximum(shortfall, 0.0)), floor)
+
+@lru_cache(maxsize=64)
+def _generate_history(symbol: str, base_price: float, end_date: date) -> pd.DataFrame:
+    """Generate HISTORY_DAYS of daily OHLCV data ending at end_date (cached)"""
+    days = HISTORY_DAYS
+    dates = pd.date_range(end=pd.Timestamp(end_date), periods=days, freq='D')
+    
+    # Seeded from symbol and day so the series is stable across calls and processes
+    rng = np.random.default_rng([zlib.crc32(symbol.encode()), end_date.toordinal()])
+    
+    # Random walk with slight upward bias: 0.05% average daily return, 2% volatility.
+    # The start is chosen so the walk ends at base_price, so every tail slice finishes
+    # near the current quote; the price never goes below $10 on any day
+    daily_returns = rng.normal(0.0005, 0.02, days)
+    start_price = base_price / np.prod(1 + daily_returns)
+    close_price = _floored_walk(start_price, daily_returns, 10.0)
+    
+    # Generate OHLC data
+    daily_volatility = rng.uniform(0.005, 0.03, days)
+    high = close_price * (1 + daily_volatility)
+    low = close_price * (1 - daily_volatility)
+    open_price = rng.uniform(low, high)
+    volume = rng.integers(5000000, 80000001, days)
+    
+    # Round each column in place; the arrays are not reused unrounded
+    for column in (open_price, high, low, close_price):
+        np.round(column, 2, out=column)
+    
+    # Cents-rounded prices fit float32 and volumes (< 80M) fit uint32, halving the frame
+    close_price = close_price.astype(np.float32)
+    return pd.DataFrame({
+        'symbol': symbol,
+        'date': dates,
+        'open': open_price.astype(np.float32),
+        'high': high.astype(np.float32),
+        'low': low.astype(np.float32),
+        'close': close_price,
+        'volume': volume.astype(np.uint32),
+        'adjusted_close': close_price
+    }, columns=HISTORICAL_COLUMNS)
+
+_SYMBOL_META = {
+    'AAPL': {'name': 'Apple Inc.', 'sector': 'Technology', 'base_price': 180},
+    'MSFT': {'name': 'Microsoft Corp.', 'sector': 'Technology', 'base_price': 350},
+    'GOOGL': {'name': 'Alphabet Inc.', 'sector': 'Technology', 'base_price': 140},
+    'AMZN': {'name': 'Amazon.com Inc.', 'sector': 'Consumer Discretionary', 'base_price': 130},
+    'TSLA': {'name': 'Tesla Inc.', 'sector': 'Automotive', 'base_price': 220},
+    'META': {'name': 'Meta Platforms Inc.', 'sector': 'Technology', 'base_price': 320},
+    'NFLX': {'name': 'Netflix Inc.', 'sector': 'Entertainment', 'base_price': 450},
+    'NVDA': {'name': 'NVIDIA Corp.', 'sector': 'Technology', 'base_price': 900},
+    'AMD': {'name': 'Advanced Micro Devices Inc.', 'sector': 'Technology', 'base_price': 140},
+    'ORCL': {'name': 'Oracle Corp.', 'sector': 'Technology', 'base_price': 110}
+}
 
 class MockMarketService:
     """Mock service for market data"""
     
     def __init__(self):
-        self.symbols = {
-            'AAPL': {'name': 'Apple Inc.', 'sector': 'Technology', 'base_price': 180},
-            'MSFT': {'name': 'Microsoft Corp.', 'sector': 'Technology', 'base_price': 350},
-            'GOOGL': {'name': 'Alphabet Inc.', 'sector': 'Technology', 'base_price': 140},
-            'AMZN': {'name': 'Amazon.com Inc.', 'sector': 'Consumer Discretionary', 'base_price': 130},
-            'TSLA': {'name': 'Tesla Inc.', 'sector': 'Automotive', 'base_price': 220},
-            'META': {'name': 'Meta Platforms Inc.', 'sector': 'Technology', 'base_price': 320},
-            'NFLX': {'name': 'Netflix Inc.', 'sector': 'Entertainment', 'base_price': 450},
-            'NVDA': {'name': 'NVIDIA Corp.', 'sector': 'Technology', 'base_price': 900},
-            'AMD': {'name': 'Advanced Micro Devices Inc.', 'sector': 'Technology', 'base_price': 140},
-            'ORCL': {'name': 'Oracle Corp.', 'sector': 'Technology', 'base_price': 110}
-        }
+        # One generator per service instance, shared by every mock draw
+        self._rng = np.random.default_rng()
+        self.symbols = {symbol: dict(meta) for symbol, meta in _SYMBOL_META.items()}
+        
+        # Column-wise copies of the symbol metadata for the vectorized draws
+        self._symbols = tuple(_SYMBOL_META)
+        self._names = tuple(meta['name'] for meta in _SYMBOL_META.values())
+        self._sectors = tuple(meta['sector'] for meta in _SYMBOL_META.values())
+        self._base = np.array([meta['base_price'] for meta in _SYMBOL_META.values()], dtype=np.float64)
+        self._idx = {symbol: i for i, symbol in enumerate(self._symbols)}
     
-    def get_current_prices(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def get_current_prices(self, symbols: Optional[List[str]] = None) -> List['StockQuote']:
         """Get current market prices for symbols"""
         if symbols is None:
-            symbols = list(self.symbols.keys())
-        
-        market_data = []
-        
-        for symbol in symbols:
-            if symbol not in self.symbols:
-                continue
-                
-            info = self.symbols[symbol]
-            base_price = info['base_price']
-            
-            # Generate realistic price movement
-            daily_change_pct = random.uniform(-5.0, 5.0)
-            current_price = base_price * (1 + daily_change_pct / 100)
-            change_amount = current_price - base_price
-            
-            # Generate volume
-            avg_volume = random.randint(10000000, 100000000)
-            volume = int(avg_volume * random.uniform(0.5, 2.0))
-            
-            # Calculate other metrics
-            day_high = current_price * random.uniform(1.01, 1.05)
-            day_low = current_price * random.uniform(0.95, 0.99)
-            
-            market_data.append({
-                'symbol': symbol,
-                'company_name': info['name'],
-                'sector': info['sector'],
-                'current_price': round(current_price, 2),
-                'change_amount': round(change_amount, 2),
-                'change_percent': round(daily_change_pct, 2),
-                'volume': volume,
-                'day_high': round(day_high, 2),
-                'day_low': round(day_low, 2),
-                'market_cap': round(random.uniform(500, 3000), 1),  # in billions
-                'pe_ratio': round(random.uniform(15, 35), 1),
-                'week_52_high': round(current_price * random.uniform(1.2, 1.5), 2),
-                'week_52_low': round(current_price * random.uniform(0.6, 0.8), 2),
-                'last_updated': datetime.now().isoformat()
-            })
-        
-        return market_data
+            idxs = np.arange(len(self._symbols))
+        else:
+            idxs = np.fromiter((self._idx[symbol] for symbol in symbols if symbol in self._idx),
+                               dtype=np.intp)
+        count = len(idxs)
+        base_prices = self._base[idxs]
+        
+        # Generate realistic price movement for all symbols in one draw per metric
+        rng = self._rng
+        daily_change_pct = rng.uniform(-5.0, 5.0, count)
+        current_price = base_prices * (1 + daily_change_pct / 100)
+        change_amount = current_price - base_prices
+        
+        # Generate volume
+        avg_volume = rng.integers(10000000, 100000001, count)
+        volume = (avg_volume * rng.uniform(0.5, 2.0, count)).astype(np.int64)
+        
+        # Calculate other metrics
+        day_high = current_price * rng.uniform(1.01, 1.05, count)
+        day_low = current_price * rng.uniform(0.95, 0.99, count)
+        market_cap = rng.uniform(500, 3000, count)  # in billions
+        pe_ratio = rng.uniform(15, 35, count)
+        week_52_high = current_price * rng.uniform(1.2, 1.5, count)
+        week_52_low = current_price * rng.uniform(0.6, 0.8, count)
+        
+        now_iso = datetime.now().isoformat()
+        return [
+            {
+                'symbol': self._symbols[i],
+                'company_name': self._names[i],
+                'sector': self._sectors[i],
+                'current_price': price,
+                'change_amount': amount,
+                'change_percent': pct,
+                'volume': vol,
+                'day_high': high,
+                'day_low': low,
+                'market_cap': cap,
+                'pe_ratio': pe,
+                'week_52_high': high_52,
+                'week_52_low': low_52,
+                'last_updated': now_iso
+            }
+            for i, price, amount, pct, vol, high, low, cap, pe, high_52, low_52 in zip(
+                idxs.tolist(),
+                np.round(current_price, 2, out=current_price).tolist(),
+                np.round(change_amount, 2, out=change_amount).tolist(),
+                np.round(daily_change_pct, 2, out=daily_change_pct).tolist(),
+                volume.tolist(),
+                np.round(day_high, 2, out=day_high).tolist(),
+                np.round(day_low, 2, out=day_low).tolist(),
+                np.round(market_cap, 1, out=market_cap).tolist(),
+                np.round(pe_ratio, 1, out=pe_ratio).tolist(),
+                np.round(week_52_high, 2, out=week_52_high).tolist(),
+                np.round(week_52_low, 2, out=week_52_low).tolist()
+            )
+        ]
     
-    def get_historical_data(self, symbol: str, period: str = "1Y") -> List[Dict[str, Any]]:
-        """Get historical price data for a symbol"""
-        if symbol not in self.symbols:
-            return []
+    def get_historical_data(self, symbol: str, period: str = "1Y") -> pd.DataFrame:
+        """
+        Get historical price data for a symbol
+        
+        Returns a DataFrame with a datetime64 'date' column, built straight from
+        the generated arrays. Use get_historical_records() for a list of dicts.
+        """
+        i = self._idx.get(symbol)
+        if i is None:
+            return pd.DataFrame(columns=HISTORICAL_COLUMNS)
         
         # Determine number of days based on period
-        period_days = {
-            "1D": 1, "5D": 5, "1M": 30, "3M": 90, 
-            "6M": 180, "1Y": 365, "2Y": 730, "5Y": 1825
-        }
-        days = period_days.get(period, 365)
-        
-        # Generate historical data
-        dates = []
-        current_date = datetime.now()
-        for i in range(days):
-            dates.append(current_date - timedelta(days=i))
-        dates.reverse()
-        
-        base_price = self.symbols[symbol]['base_price']
-        historical_data = []
-        
-        # Generate price series with realistic movement
-        price = base_price
-        for date in dates:
-            # Random walk with slight upward bias
-            daily_return = random.gauss(0.0005, 0.02)  # 0.05% average daily return, 2% volatility
-            price = max(price * (1 + daily_return), 10)  # Ensure price doesn't go below $10
-            
-            # Generate OHLC data
-            daily_volatility = random.uniform(0.005, 0.03)
-            high = price * (1 + daily_volatility)
-            low = price * (1 - daily_volatility)
-            open_price = random.uniform(low, high)
-            close_price = price
-            
-            volume = random.randint(5000000, 80000000)
-            
-            historical_data.append({
-                'symbol': symbol,
-                'date': date.strftime('%Y-%m-%d'),
-                'open': round(open_price, 2),
-                'high': round(high, 2),
-                'low': round(low, 2),
-                'close': round(close_price, 2),
-                'volume': volume,
-                'adjusted_close': round(close_price, 2)
-            })
-        
-        return historical_data
+        days = PERIOD_DAYS.get(period, 365)
+        
+        # Every period is the tail of one cached full-length series per symbol and day
+        history = _generate_history(symbol, float(self._base[i]), date.today())
+        return history.iloc[-days:].reset_index(drop=True)
+    
+    def get_historical_records(self, symbol: str, period: str = "1Y") -> List[Dict[str, Any]]:
+        """Get historical price data as a list of dicts with 'YYYY-MM-DD' date strings"""
+        frame = self.get_historical_data(symbol, period)
+        if frame.empty:
+            return []
+        # Widen the float32 prices back to 2-decimal float64 so records hold e.g. 180.01, not 180.00999...
+        prices = frame[PRICE_COLUMNS].astype(np.float64).round(2)
+        return frame.assign(date=frame['date'].dt.strftime('%Y-%m-%d'), **prices).to_dict('records')
     
     def get_market_indices(self) -> List[Dict[str, Any]]:
         """Get major market indices data"""
-        indices = {
-            '^GSPC': {'name': 'S&P 500', 'base_value': 4500},
-            '^DJI': {'name': 'Dow Jones Industrial Average', 'base_value': 35000},
-            '^IXIC': {'name': 'NASDAQ Composite', 'base_value': 14000},
-            '^RUT': {'name': 'Russell 2000', 'base_value': 2000},
-            '^VIX': {'name': 'CBOE Volatility Index', 'base_value': 20}
-        }
+        count = len(MARKET_INDICES)
+        rng = self._rng
+        change_pct = rng.uniform(-2.0, 2.0, count)
+        change_pct[VIX_POSITION] = rng.uniform(-10.0, 10.0)  # VIX behaves differently
         
-        market_indices = []
-        for symbol, info in indices.items():
-            change_pct = random.uniform(-2.0, 2.0)
-            if symbol == '^VIX':  # VIX behaves differently
-                change_pct = random.uniform(-10.0, 10.0)
-            
-            current_value = info['base_value'] * (1 + change_pct / 100)
-            change_amount = current_value - info['base_value']
-            
-            market_indices.append({
+        current_value = INDEX_BASE_VALUES * (1 + change_pct / 100)
+        change_amount = current_value - INDEX_BASE_VALUES
+        
+        now_iso = datetime.now().isoformat()
+        return [
+            {
                 'symbol': symbol,
-                'name': info['name'],
-                'current_value': round(current_value, 2),
-                'change_amount': round(change_amount, 2),
-                'change_percent': round(change_pct, 2),
-                'last_updated': datetime.now().isoformat()
-            })
-        
-        return market_indices
+                'name': name,
+                'current_value': value,
+                'change_amount': amount,
+                'change_percent': pct,
+                'last_updated': now_iso
+            }
+            for (symbol, name, _), value, amount, pct in zip(
+                MARKET_INDICES,
+                np.round(current_value, 2, out=current_value).tolist(),
+                np.round(change_amount, 2, out=change_amount).tolist(),
+                np.round(change_pct, 2, out=change_pct).tolist()
+            )
+        ]
     
     def get_sector_performance(self) -> List[Dict[str, Any]]:
         """Get sector performance data"""
-        sectors = [
-            'Technology', 'Healthcare', 'Financial Services', 'Consumer Discretionary',
-            'Communication Services', 'Industrials', 'Consumer Staples', 
-            'Energy', 'Utilities', 'Real Estate', 'Materials'
-        ]
+        count = len(SECTORS)
+        rng = self._rng
+        change_pct = rng.uniform(-3.0, 3.0, count)
+        market_cap = rng.uniform(1000, 15000, count)  # in billions
+        pe_ratio = rng.uniform(15, 30, count)
+        dividend_yield = rng.uniform(0.5, 4.0, count)
+        
+        # Best performers first; a stable sort on the rounded values keeps ties in sector order
+        np.round(change_pct, 2, out=change_pct)
+        order = np.argsort(-change_pct, kind='stable')
         
-        sector_data = []
-        for sector in sectors:
-            change_pct = random.uniform(-3.0, 3.0)
-            
-            sector_data.append({
-                'sector': sector,
-                'change_percent': round(change_pct, 2),
-                'market_cap': round(random.uniform(1000, 15000), 1),  # in billions
-                'pe_ratio': round(random.uniform(15, 30), 1),
-                'dividend_yield': round(random.uniform(0.5, 4.0), 2)
-            })
-        
-        return sorted(sector_data, key=lambda x: x['change_percent'], reverse=True)
+        return [
+            {
+                'sector': SECTORS[i],
+                'change_percent': pct,
+                'market_cap': cap,
+                'pe_ratio': pe,
+                'dividend_yield': dividend
+            }
+            for i, pct, cap, pe, dividend in zip(
+                order.tolist(),
+                change_pct[order].tolist(),
+                np.round(market_cap, 1, out=market_cap)[order].tolist(),
+                np.round(pe_ratio, 1, out=pe_ratio)[order].tolist(),
+                np.round(dividend_yield, 2, out=dividend_yield)[order].tolist()
+            )
+        ]
     
-    def get_market_summary(self) -> Dict[str, Any]:
-        """Get overall market summary"""
-        indices = self.get_market_indices()
-        sectors = self.get_sector_performance()
+    def get_market_summary(self, indices: Optional[List[Dict[str, Any]]] = None,
+                           sectors: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Get overall market summary
+        
+        Pass the results of get_market_indices() / get_sector_performance() when the
+        caller already has them, so the summary matches what is on screen and
+        neither is generated twice.
+        """
+        if indices is None:
+            indices = self.get_market_indices()
+        if sectors is None:
+            sectors = self.get_sector_performance()
         
         # Calculate market statistics
         sp500_change = next((idx['change_percent'] for idx in indices if idx['symbol'] == '^GSPC'), 0)
@@ -191,8 +295,8 @@ class MockMarketService:
             'volatility_level': 'High' if vix_value > 25 else 'Medium' if vix_value > 15 else 'Low',
             'advancing_sectors': advancing_sectors,
             'declining_sectors': declining_sectors,
-            'total_market_cap': round(random.uniform(45000, 55000), 0),  # in billions
-            'trading_volume': random.randint(3000000000, 6000000000),  # shares
+            'total_market_cap': round(float(self._rng.uniform(45000, 55000)), 0),  # in billions
+            'trading_volume': int(self._rng.integers(3000000000, 6000000001)),  # shares
             'last_updated': datetime.now().isoformat()
         }
 
@@ -5,33 +5,69 @@ Provides sample news data for development and testing
 
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
+from collections import Counter
+from operator import itemgetter
 import random
+import time
+
+COMPANIES = (
+    'Apple Inc.', 'Microsoft Corp.', 'Amazon.com Inc.', 'Alphabet Inc.',
+    'Tesla Inc.', 'Meta Platforms Inc.', 'Netflix Inc.', 'NVIDIA Corp.'
+)
+NEWS_SOURCES = (
+    'Reuters', 'Bloomberg', 'Financial Times', 'Wall Street Journal',
+    'CNBC', 'MarketWatch', 'Yahoo Finance', 'Seeking Alpha'
+)
+NEWS_CATEGORIES = (
+    'Earnings', 'Product Launch', 'Merger & Acquisition', 'Partnership',
+    'Regulation', 'Market Analysis', 'Leadership Change', 'Innovation'
+)
+
+# Shared pool that company news and sentiment analysis are derived from
+NEWS_POOL_SIZE = 100
+NEWS_POOL_TTL_SECONDS = 60.0
+
+# Headline template and word choices per category; {c} company, {a} choice, {n} quarter
+HEADLINE_TEMPLATES = {
+    'Earnings': ("{c} Reports {a} Q{n} Earnings", ('Strong', 'Weak', 'Mixed')),
+    'Product Launch': ("{c} Unveils {a} Product Line", ('Revolutionary', 'New', 'Updated')),
+    'Merger & Acquisition': ("{c} {a} Tech Startup", ('Acquires', 'Merges with', 'Partners with')),
+    'Partnership': ("{c} Forms Strategic Partnership with Industry Leader", None),
+    'Regulation': ("New Regulations Impact {c}'s Operations", None),
+    'Market Analysis': ("Analysts {a} {c} Rating", ('Upgrade', 'Downgrade', 'Maintain')),
+    'Leadership Change': ("{c} Announces {a} Transition", ('CEO', 'CFO', 'CTO')),
+    'Innovation': ("{c} Breakthrough in {a} Technology", ('AI', 'Cloud', 'Hardware'))
+}
 
 class MockNewsService:
     """Mock service for financial news data"""
     
     def __init__(self):
-        self.companies = [
-            'Apple Inc.', 'Microsoft Corp.', 'Amazon.com Inc.', 'Alphabet Inc.',
-            'Tesla Inc.', 'Meta Platforms Inc.', 'Netflix Inc.', 'NVIDIA Corp.'
-        ]
-        self.news_sources = [
-            'Reuters', 'Bloomberg', 'Financial Times', 'Wall Street Journal',
-            'CNBC', 'MarketWatch', 'Yahoo Finance', 'Seeking Alpha'
-        ]
-        self.news_categories = [
-            'Earnings', 'Product Launch', 'Merger & Acquisition', 'Partnership',
-            'Regulation', 'Market Analysis', 'Leadership Change', 'Innovation'
-        ]
+        self.companies = COMPANIES
+        self.news_sources = NEWS_SOURCES
+        self.news_categories = NEWS_CATEGORIES
+        self._pool: List[Dict[str, Any]] = []
+        self._pool_expires_at = 0.0
+    
+    @staticmethod
+    def _make_headline(company: str, category: str) -> str:
+        """Build a sample headline from the category's template"""
+        template, choices = HEADLINE_TEMPLATES.get(category, ("{c} News Update", None))
+        return template.format(
+            c=company,
+            a=random.choice(choices) if choices else '',
+            n=random.randint(1, 4) if category == 'Earnings' else ''
+        )
     
     def get_latest_news(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get latest financial news"""
         news_items = []
+        now = datetime.now()
         
         for i in range(limit):
-            company = random.choice(self.companies)
-            source = random.choice(self.news_sources)
-            category = random.choice(self.news_categories)
+            company = random.choice(COMPANIES)
+            source = random.choice(NEWS_SOURCES)
+            category = random.choice(NEWS_CATEGORIES)
             
             # Generate realistic sentiment
             sentiment_score = random.uniform(-1.0, 1.0)
@@ -42,72 +78,76 @@ class MockNewsService:
             else:
                 sentiment = 'Neutral'
             
-            # Generate sample headline
-            headlines = {
-                'Earnings': f"{company} Reports {random.choice(['Strong', 'Weak', 'Mixed'])} Q{random.randint(1,4)} Earnings",
-                'Product Launch': f"{company} Unveils {random.choice(['Revolutionary', 'New', 'Updated'])} Product Line",
-                'Merger & Acquisition': f"{company} {random.choice(['Acquires', 'Merges with', 'Partners with'])} Tech Startup",
-                'Partnership': f"{company} Forms Strategic Partnership with Industry Leader",
-                'Regulation': f"New Regulations Impact {company}'s Operations",
-                'Market Analysis': f"Analysts {random.choice(['Upgrade', 'Downgrade', 'Maintain'])} {company} Rating",
-                'Leadership Change': f"{company} Announces {random.choice(['CEO', 'CFO', 'CTO'])} Transition",
-                'Innovation': f"{company} Breakthrough in {random.choice(['AI', 'Cloud', 'Hardware'])} Technology"
-            }
+            published_at = now - timedelta(hours=random.randint(1, 72))
             
             news_item = {
                 'id': f"news_{i+1}",
-                'headline': headlines.get(category, f"{company} News Update"),
+                'headline': self._make_headline(company, category),
                 'company': company,
                 'source': source,
                 'category': category,
                 'sentiment': sentiment,
                 'sentiment_score': round(sentiment_score, 3),
                 'impact_score': round(random.uniform(0.1, 1.0), 3),
-                'published_at': (datetime.now() - timedelta(hours=random.randint(1, 72))).isoformat(),
+                'published_at': published_at.isoformat(),
+                'published_at_ts': published_at.timestamp(),
                 'url': f"https://example.com/news/{i+1}",
                 'summary': f"Latest developments from {company} regarding {category.lower()}..."
             }
             
             news_items.append(news_item)
         
-        return sorted(news_items, key=lambda x: x['published_at'], reverse=True)
+        return sorted(news_items, key=itemgetter('published_at_ts'), reverse=True)
+    
+    def _news_pool(self) -> List[Dict[str, Any]]:
+        """Latest NEWS_POOL_SIZE items, regenerated at most once per NEWS_POOL_TTL_SECONDS"""
+        now = time.monotonic()
+        if now >= self._pool_expires_at:
+            self._pool = self.get_latest_news(NEWS_POOL_SIZE)
+            self._pool_expires_at = now + NEWS_POOL_TTL_SECONDS
+        return self._pool
+    
+    def invalidate_cache(self) -> None:
+        """Drop the cached news pool so the next call generates a fresh one"""
+        self._pool = []
+        self._pool_expires_at = 0.0
     
     def get_company_news(self, company: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get news for a specific company"""
-        all_news = self.get_latest_news(50)
-        company_news = [news for news in all_news if company.lower() in news['company'].lower()]
-        return company_news[:limit]
+        company = company.lower()
+        company_news = [news for news in self._news_pool() if company in news['company'].lower()]
+        # Items are shared with the cached pool; hand out copies so callers may edit them
+        return [dict(news) for news in company_news[:limit]]
     
     def get_sentiment_analysis(self, period_days: int = 30) -> Dict[str, Any]:
         """Get sentiment analysis for the specified period"""
-        news_items = self.get_latest_news(100)
+        news_items = self._news_pool()
         
         # Filter by date range
-        cutoff_date = datetime.now() - timedelta(days=period_days)
-        recent_news = [
-            news for news in news_items 
-            if datetime.fromisoformat(news['published_at']) > cutoff_date
-        ]
+        cutoff_ts = (datetime.now() - timedelta(days=period_days)).timestamp()
+        recent_news = [news for news in news_items if news['published_at_ts'] > cutoff_ts]
         
         if not recent_news:
             return {'error': 'No news found for the specified period'}
         
-        # Calculate sentiment statistics
-        sentiments = [news['sentiment_score'] for news in recent_news]
-        sentiment_counts = {}
+        # Calculate sentiment statistics in a single pass
+        sentiment_counts = Counter()
+        source_counts = Counter()
+        category_counts = Counter()
+        sentiment_total = 0.0
         for news in recent_news:
-            sentiment = news['sentiment']
-            sentiment_counts[sentiment] = sentiment_counts.get(sentiment, 0) + 1
+            sentiment_counts[news['sentiment']] += 1
+            source_counts[news['source']] += 1
+            category_counts[news['category']] += 1
+            sentiment_total += news['sentiment_score']
         
         return {
             'total_articles': len(recent_news),
-            'average_sentiment': round(sum(sentiments) / len(sentiments), 3),
-            'sentiment_distribution': sentiment_counts,
+            'average_sentiment': round(sentiment_total / len(recent_news), 3),
+            'sentiment_distribution': dict(sentiment_counts),
             'period_days': period_days,
-            'most_active_source': max(set([news['source'] for news in recent_news]), 
-                                    key=[news['source'] for news in recent_news].count),
-            'dominant_category': max(set([news['category'] for news in recent_news]), 
-                                   key=[news['category'] for news in recent_news].count)
+            'most_active_source': source_counts.most_common(1)[0][0],
+            'dominant_category': category_counts.most_common(1)[0][0]
         }
 
 # Create instance for export
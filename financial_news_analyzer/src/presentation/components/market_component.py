@@ -6,20 +6,16 @@ Streamlit components for displaying market data
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple, Union
+import numpy as np
 import pandas as pd
 
-class MarketComponent:
-    """Component for rendering market-related UI elements"""
-    
-    @staticmethod
-    def render_stock_card(stock_data: Dict[str, Any]) -> None:
-        """Render a single stock card"""
-        change_color = '#00D4AA' if stock_data.get('change_percent', 0) >= 0 else '#FF6B6B'
-        change_symbol = '+' if stock_data.get('change_percent', 0) >= 0 else ''
-        
-        with st.container():
-            st.markdown(f"""
+from ...domain.entities.market_data import StockQuote
+
+TableData = Union[pd.DataFrame, List[Dict[str, Any]]]
+
+# Stock card markup, filled with str.format_map from a StockQuote plus the change color and sign
+_STOCK_CARD_TMPL = """
             <div style="
                 background: var(--secondary-bg);
                 padding: 15px;
@@ -30,43 +26,87 @@ class MarketComponent:
             ">
                 <div style="display: flex; justify-content: space-between; align-items: center;">
                     <div>
-                        <h3 style="color: white; margin: 0;">{stock_data.get('symbol', 'N/A')}</h3>
+                        <h3 style="color: white; margin: 0;">{symbol}</h3>
                         <p style="color: #CCCCCC; margin: 5px 0;">
-                            {stock_data.get('company_name', 'Company Name')}
+                            {company_name}
                         </p>
                     </div>
                     <div style="text-align: right;">
                         <h3 style="color: white; margin: 0;">
-                            ${stock_data.get('current_price', 0):.2f}
+                            ${current_price:.2f}
                         </h3>
                         <p style="color: {change_color}; margin: 5px 0; font-weight: bold;">
-                            {change_symbol}{stock_data.get('change_amount', 0):.2f} 
-                            ({change_symbol}{stock_data.get('change_percent', 0):.2f}%)
+                            {change_symbol}{change_amount:.2f} 
+                            ({change_symbol}{change_percent:.2f}%)
                         </p>
                     </div>
                 </div>
                 <div style="margin-top: 10px; font-size: 0.9em; color: #CCCCCC;">
-                    Volume: {stock_data.get('volume', 0):,} | 
-                    Market Cap: ${stock_data.get('market_cap', 0):.1f}B | 
-                    P/E: {stock_data.get('pe_ratio', 0):.1f}
+                    Volume: {volume:,} | 
+                    Market Cap: ${market_cap:.1f}B | 
+                    P/E: {pe_ratio:.1f}
                 </div>
             </div>
-            """, unsafe_allow_html=True)
+            """
+
+class MarketComponent:
+    """
+    Component for rendering market-related UI elements
+    
+    Chart renderers accept either a DataFrame or a list of dicts. Callers that
+    draw several charts from the same data should convert once with to_frame()
+    and pass the frame to each renderer.
+    """
+    
+    @staticmethod
+    def to_frame(data: TableData) -> pd.DataFrame:
+        """Convert list-of-dicts data to a DataFrame; DataFrames pass through unchanged"""
+        if isinstance(data, pd.DataFrame):
+            return data
+        return pd.DataFrame(data)
+    
+    @staticmethod
+    def _date_axis(df: pd.DataFrame) -> np.ndarray:
+        """Daily date column as a datetime64[D] array, parsing only when it is not already datetime64"""
+        dates = df['date']
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates)
+        return dates.to_numpy(dtype='datetime64[D]')
+    
+    @staticmethod
+    def _change_styling(changes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Bar colors (green up, red down) and '+1.2%' labels for an array of percent changes"""
+        colors = np.where(changes >= 0, '#00D4AA', '#FF6B6B')
+        labels = np.char.mod('%+.1f%%', changes)
+        return colors, labels
+    
+    @staticmethod
+    def render_stock_card(stock_data: StockQuote) -> None:
+        """Render a single stock card"""
+        positive = stock_data['change_percent'] >= 0
+        card = {
+            **stock_data,
+            'change_color': '#00D4AA' if positive else '#FF6B6B',
+            'change_symbol': '+' if positive else ''
+        }
+        
+        with st.container():
+            st.markdown(_STOCK_CARD_TMPL.format_map(card), unsafe_allow_html=True)
     
     @staticmethod
-    def render_candlestick_chart(historical_data: List[Dict[str, Any]], symbol: str) -> go.Figure:
+    def render_candlestick_chart(historical_data: TableData, symbol: str) -> go.Figure:
         """Render candlestick chart for a stock"""
-        df = pd.DataFrame(historical_data)
+        df = MarketComponent.to_frame(historical_data)
         
         if df.empty:
             return go.Figure()
         
         fig = go.Figure(data=go.Candlestick(
-            x=pd.to_datetime(df['date']),
-            open=df['open'],
-            high=df['high'],
-            low=df['low'],
-            close=df['close'],
+            x=MarketComponent._date_axis(df),
+            open=df['open'].to_numpy(),
+            high=df['high'].to_numpy(),
+            low=df['low'].to_numpy(),
+            close=df['close'].to_numpy(),
             increasing_line_color='#00D4AA',
             decreasing_line_color='#FF6B6B',
             name=symbol
@@ -86,9 +126,9 @@ class MarketComponent:
         return fig
     
     @staticmethod
-    def render_volume_chart(historical_data: List[Dict[str, Any]]) -> go.Figure:
+    def render_volume_chart(historical_data: TableData) -> go.Figure:
         """Render volume chart"""
-        df = pd.DataFrame(historical_data)
+        df = MarketComponent.to_frame(historical_data)
         
         if df.empty:
             return go.Figure()
@@ -96,8 +136,8 @@ class MarketComponent:
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
-            x=pd.to_datetime(df['date']),
-            y=df['volume'],
+            x=MarketComponent._date_axis(df),
+            y=df['volume'].to_numpy(),
             marker_color='#4ECDC4',
             opacity=0.7,
             name='Volume'
@@ -117,9 +157,9 @@ class MarketComponent:
         return fig
     
     @staticmethod
-    def render_market_overview(market_data: List[Dict[str, Any]]) -> go.Figure:
+    def render_market_overview(market_data: TableData) -> go.Figure:
         """Render market overview chart"""
-        df = pd.DataFrame(market_data)
+        df = MarketComponent.to_frame(market_data)
         
         if df.empty:
             return go.Figure()
@@ -127,16 +167,17 @@ class MarketComponent:
         # Sort by change percentage
         df = df.sort_values('change_percent', ascending=True)
         
-        # Color based on performance
-        colors = ['#00D4AA' if change >= 0 else '#FF6B6B' for change in df['change_percent']]
+        # Color and label based on performance
+        changes = df['change_percent'].to_numpy()
+        colors, labels = MarketComponent._change_styling(changes)
         
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
             x=df['symbol'],
-            y=df['change_percent'],
+            y=changes,
             marker_color=colors,
-            text=[f"{pct:+.1f}%" for pct in df['change_percent']],
+            text=labels,
             textposition='auto',
             hovertemplate='<b>%{x}</b><br>' +
                           'Change: %{y:.2f}%<br>' +
@@ -160,9 +201,9 @@ class MarketComponent:
         return fig
     
     @staticmethod
-    def render_sector_performance(sector_data: List[Dict[str, Any]]) -> go.Figure:
+    def render_sector_performance(sector_data: TableData) -> go.Figure:
         """Render sector performance chart"""
-        df = pd.DataFrame(sector_data)
+        df = MarketComponent.to_frame(sector_data)
         
         if df.empty:
             return go.Figure()
@@ -170,16 +211,17 @@ class MarketComponent:
         # Sort by performance
         df = df.sort_values('change_percent', ascending=True)
         
-        colors = ['#00D4AA' if change >= 0 else '#FF6B6B' for change in df['change_percent']]
+        changes = df['change_percent'].to_numpy()
+        colors, labels = MarketComponent._change_styling(changes)
         
         fig = go.Figure()
         
         fig.add_trace(go.Bar(
             y=df['sector'],
-            x=df['change_percent'],
+            x=changes,
             orientation='h',
             marker_color=colors,
-            text=[f"{pct:+.1f}%" for pct in df['change_percent']],
+            text=labels,
             textposition='auto'
         ))
         
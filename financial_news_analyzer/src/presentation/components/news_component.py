@@ -5,24 +5,42 @@ Streamlit components for displaying financial news
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
-from typing import Dict, Any, List
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, Any, List, Tuple, Union
+from datetime import date, datetime, timedelta
+from collections import Counter
+import html
+from types import MappingProxyType
+import string
 
-class NewsComponent:
-    """Component for rendering news-related UI elements"""
-    
-    @staticmethod
-    def render_news_card(news_item: Dict[str, Any]) -> None:
-        """Render a single news card"""
-        sentiment_color = {
-            'Positive': '#00D4AA',
-            'Negative': '#FF6B6B',
-            'Neutral': '#4ECDC4'
-        }.get(news_item.get('sentiment', 'Neutral'), '#4ECDC4')
-        
-        with st.container():
-            st.markdown(f"""
+# numpy and pandas are imported where used (timeline downsampling, DataFrame feeds)
+# so importing this module does not pay for them
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+_SENTIMENT_COLORS = MappingProxyType({
+    'Positive': '#00D4AA',
+    'Negative': '#FF6B6B',
+    'Neutral': '#4ECDC4'
+})
+
+# News filter choices; module-level so every rerun passes the same objects
+_SENTIMENT_OPTIONS = ('Positive', 'Negative', 'Neutral')
+_SOURCE_OPTIONS = ('Reuters', 'Bloomberg', 'CNBC', 'Financial Times', 'Wall Street Journal')
+_CATEGORY_OPTIONS = ('Earnings', 'Product Launch', 'Market Analysis', 'Merger', 'Partnership')
+NEWS_DATE_RANGE_KEY = "news_date_range"
+
+# News card markup, filled with str.format_map; keys missing from the item fall back to these defaults.
+# These fields are free text and are HTML-escaped before going into the template.
+_NEWS_CARD_DEFAULTS: Dict[str, Any] = {
+    'headline': 'News Headline',
+    'company': 'N/A',
+    'source': 'N/A',
+    'sentiment': 'N/A',
+    'summary': 'No summary available.',
+}
+
+_NEWS_CARD_TMPL = """
             <div style="
                 background: var(--secondary-bg);
                 padding: 15px;
@@ -32,78 +50,265 @@ class NewsComponent:
                 box-shadow: 0 2px 10px rgba(0,0,0,0.2);
             ">
                 <h4 style="color: {sentiment_color}; margin: 0 0 10px 0;">
-                    {news_item.get('headline', 'News Headline')}
+                    {headline}
                 </h4>
                 <p style="margin: 5px 0; color: #CCCCCC;">
-                    <strong>Company:</strong> {news_item.get('company', 'N/A')} | 
-                    <strong>Source:</strong> {news_item.get('source', 'N/A')} | 
-                    <strong>Sentiment:</strong> {news_item.get('sentiment', 'N/A')}
+                    <strong>Company:</strong> {company} | 
+                    <strong>Source:</strong> {source} | 
+                    <strong>Sentiment:</strong> {sentiment}
                 </p>
                 <p style="margin: 5px 0; color: #FAFAFA;">
-                    {news_item.get('summary', 'No summary available.')}
+                    {summary}
                 </p>
             </div>
-            """, unsafe_allow_html=True)
+            """
+
+# _NEWS_CARD_TMPL split into (literal text, following field name) pairs for column-wise assembly
+_NEWS_CARD_PARTS = tuple(
+    (literal, field) for literal, field, _, _ in string.Formatter().parse(_NEWS_CARD_TMPL)
+)
+
+# Summary bar: four metrics in one markdown element (hover shows each metric's help text);
+# values are HTML-escaped before formatting since sources and categories come from news data
+_SUMMARY_DEFAULTS: Dict[str, Any] = {
+    'total_articles': 0,
+    'average_sentiment': 0,
+    'most_active_source': 'N/A',
+    'dominant_category': 'N/A',
+}
+
+_SUMMARY_TMPL = """
+<div style="display: flex; gap: 1rem; margin: 10px 0;">
+    <div title="Total number of news articles" style="flex: 1; min-width: 0;">
+        <div style="font-size: 0.875rem; color: #CCCCCC;">Total Articles</div>
+        <div style="font-size: 1.75rem; color: #FAFAFA; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{total_articles}</div>
+    </div>
+    <div title="Average sentiment score (-1 to 1)" style="flex: 1; min-width: 0;">
+        <div style="font-size: 0.875rem; color: #CCCCCC;">Avg Sentiment</div>
+        <div style="font-size: 1.75rem; color: #FAFAFA; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{average_sentiment}</div>
+    </div>
+    <div title="Source with most articles" style="flex: 1; min-width: 0;">
+        <div style="font-size: 0.875rem; color: #CCCCCC;">Most Active Source</div>
+        <div style="font-size: 1.75rem; color: #FAFAFA; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{most_active_source}</div>
+    </div>
+    <div title="Most common news category" style="flex: 1; min-width: 0;">
+        <div style="font-size: 0.875rem; color: #CCCCCC;">Dominant Category</div>
+        <div style="font-size: 1.75rem; color: #FAFAFA; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">{dominant_category}</div>
+    </div>
+</div>
+"""
+
+# Figures are rebuilt only when their input data changes; cache hits return a copy
+FIGURE_CACHE_TTL = 60
+FIGURE_CACHE_ENTRIES = 32
+
+# Timeline lines longer than this are downsampled before being sent to the browser
+TIMELINE_MAX_POINTS = 1000
+
+def _published_day(published_at: Union[str, datetime]) -> date:
+    """Calendar day of an ISO-8601 timestamp string or datetime"""
+    if isinstance(published_at, str):
+        return date.fromisoformat(published_at[:10])
+    return published_at.date()
+
+def _lttb_indices(x: 'np.ndarray', y: 'np.ndarray', threshold: int) -> 'np.ndarray':
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling
+    
+    Keeps the first and last points and, from each of threshold - 2 equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the average of the next bucket.
+    """
+    import numpy as np
+    
+    n = len(x)
+    if threshold < 3 or n <= threshold:
+        return np.arange(n)
+    
+    edges = (np.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(np.intp) + 1
+    edges[-1] = n - 1
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    
+    kept = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[kept] - avg_x) * (y[start:end] - y[kept])
+                      - (x[kept] - x[start:end]) * (avg_y - y[kept]))
+        kept = start + int(np.argmax(area))
+        selected[bucket + 1] = kept
+    
+    return selected
+
+SENTIMENT_LABEL_MAX_BARS = 10
+
+# Plotly config for read-only summary charts: no hover/zoom handlers and no mode bar in the browser
+STATIC_CHART_CONFIG: Dict[str, Any] = {"staticPlot": True, "displayModeBar": False}
+
+# The sentiment chart's layout never changes, so it is validated once and shared by every figure
+_SENTIMENT_LAYOUT = go.Layout(
+    title="News Sentiment Distribution",
+    xaxis_title="Sentiment",
+    yaxis_title="Number of Articles",
+    template="plotly_dark",
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='white'),
+    showlegend=False,
+    uirevision='sentiment'
+)
+
+@st.cache_data(ttl=FIGURE_CACHE_TTL, max_entries=FIGURE_CACHE_ENTRIES)
+def _build_sentiment_chart(sentiment_data: Dict[str, int]) -> go.Figure:
+    """Build the sentiment distribution chart (memoized per input)"""
+    counts = list(sentiment_data.values())
+    
+    # In-bar count labels need Plotly.js text auto-fitting; beyond a handful of bars rely on hover
+    labels = {'text': counts, 'textposition': 'auto'} if len(counts) <= SENTIMENT_LABEL_MAX_BARS else {}
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            x=list(sentiment_data.keys()),
+            y=counts,
+            marker_color=['#00D4AA', '#FF6B6B', '#4ECDC4'],
+            hovertemplate="%{x}: %{y}<extra></extra>",
+            **labels
+        )
+    ], layout=_SENTIMENT_LAYOUT)
+    
+    return fig
+
+@st.cache_data(ttl=FIGURE_CACHE_TTL, max_entries=FIGURE_CACHE_ENTRIES)
+def _build_news_timeline(news_data: List[Dict[str, Any]]) -> go.Figure:
+    """Build the news timeline chart (memoized per input)"""
+    # Count articles per (day, sentiment) directly instead of via a DataFrame groupby
+    counts = Counter(
+        (_published_day(item['published_at']), item['sentiment'])
+        for item in news_data
+        if item.get('published_at') and item.get('sentiment')
+    )
+    
+    if not counts:
+        # Fallback empty chart
+        return go.Figure()
+    
+    # One line per sentiment, in order of first appearance by date (as plotly.express orders them)
+    series: Dict[str, Tuple[List[date], List[int]]] = {}
+    for (day, sentiment), count in sorted(counts.items()):
+        days, values = series.setdefault(sentiment, ([], []))
+        days.append(day)
+        values.append(count)
+    
+    # Long histories are reduced to TIMELINE_MAX_POINTS per line, keeping peaks and troughs
+    for sentiment, (days, values) in series.items():
+        if len(days) > TIMELINE_MAX_POINTS:
+            import numpy as np
+            keep = _lttb_indices(np.fromiter((day.toordinal() for day in days), dtype=np.float64),
+                                 np.asarray(values, dtype=np.float64), TIMELINE_MAX_POINTS)
+            series[sentiment] = ([days[i] for i in keep], [values[i] for i in keep])
+    
+    fig = go.Figure([
+        go.Scatter(
+            x=days,
+            y=values,
+            mode='lines',
+            name=sentiment,
+            legendgroup=sentiment,
+            line=dict(color=_SENTIMENT_COLORS.get(sentiment)),
+            hovertemplate=f"sentiment={sentiment}<br>date=%{{x}}<br>count=%{{y}}<extra></extra>"
+        )
+        for sentiment, (days, values) in series.items()
+    ])
+    
+    fig.update_layout(
+        title="News Sentiment Timeline",
+        xaxis_title="date",
+        yaxis_title="count",
+        legend_title_text="sentiment",
+        template="plotly_dark",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white')
+    )
+    
+    return fig
+
+class NewsComponent:
+    """Component for rendering news-related UI elements"""
     
     @staticmethod
-    def render_sentiment_chart(sentiment_data: Dict[str, int]) -> go.Figure:
-        """Render sentiment distribution chart"""
-        fig = go.Figure(data=[
-            go.Bar(
-                x=list(sentiment_data.keys()),
-                y=list(sentiment_data.values()),
-                marker_color=['#00D4AA', '#FF6B6B', '#4ECDC4'],
-                text=list(sentiment_data.values()),
-                textposition='auto',
-            )
-        ])
+    def _card_html(news_item: Dict[str, Any]) -> str:
+        """Build the HTML for a single news card"""
+        card = {**_NEWS_CARD_DEFAULTS, **news_item}
+        card['sentiment_color'] = _SENTIMENT_COLORS.get(card['sentiment'], '#4ECDC4')
+        for field in _NEWS_CARD_DEFAULTS:
+            card[field] = html.escape(str(card[field]))
+        return _NEWS_CARD_TMPL.format_map(card)
+    
+    @staticmethod
+    def render_news_card(news_item: Dict[str, Any]) -> None:
+        """Render a single news card"""
+        with st.container():
+            st.markdown(NewsComponent._card_html(news_item), unsafe_allow_html=True)
+    
+    @staticmethod
+    def _feed_html_from_frame(news_frame: 'pd.DataFrame') -> str:
+        """Build every card's HTML with column-wise string concatenation, one column per template field"""
+        import pandas as pd
         
-        fig.update_layout(
-            title="News Sentiment Distribution",
-            xaxis_title="Sentiment",
-            yaxis_title="Number of Articles",
-            template="plotly_dark",
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
-            showlegend=False
-        )
+        columns = {}
+        for field, default in _NEWS_CARD_DEFAULTS.items():
+            if field in news_frame.columns:
+                columns[field] = news_frame[field].fillna(default).astype(str)
+            else:
+                columns[field] = pd.Series(default, index=news_frame.index, dtype=object)
+        columns['sentiment_color'] = columns['sentiment'].map(_SENTIMENT_COLORS).fillna('#4ECDC4')
+        for field in _NEWS_CARD_DEFAULTS:
+            columns[field] = columns[field].map(html.escape)
+        
+        cards = pd.Series('', index=news_frame.index, dtype=object)
+        for literal, field in _NEWS_CARD_PARTS:
+            cards = cards + literal
+            if field is not None:
+                cards = cards + columns[field]
+        return "".join(cards.tolist())
+    
+    @staticmethod
+    def render_news_feed(news_items: Union[List[Dict[str, Any]], 'pd.DataFrame']) -> None:
+        """
+        Render news cards as a single markdown element
+        
+        Accepts a list of news dicts or a DataFrame with the same columns;
+        DataFrames are assembled column-wise without a per-row Python loop.
+        """
+        if len(news_items) == 0:
+            return
+        
+        # Only a DataFrame has .columns; checking it avoids importing pandas for list input
+        if hasattr(news_items, 'columns'):
+            feed_html = NewsComponent._feed_html_from_frame(news_items)
+        else:
+            feed_html = "".join(NewsComponent._card_html(item) for item in news_items)
         
-        return fig
+        st.markdown(feed_html, unsafe_allow_html=True)
+    
+    @staticmethod
+    def render_sentiment_chart(sentiment_data: Dict[str, int]) -> go.Figure:
+        """Render sentiment distribution chart"""
+        return _build_sentiment_chart(sentiment_data)
+    
+    @staticmethod
+    def show_sentiment_chart(sentiment_data: Dict[str, int]) -> None:
+        """Draw the sentiment chart as a read-only summary tile"""
+        st.plotly_chart(_build_sentiment_chart(sentiment_data), config=dict(STATIC_CHART_CONFIG))
     
     @staticmethod
     def render_news_timeline(news_data: List[Dict[str, Any]]) -> go.Figure:
         """Render news timeline chart"""
-        # Convert to DataFrame for easier processing
-        df = pd.DataFrame(news_data)
-        if 'published_at' in df.columns:
-            df['date'] = pd.to_datetime(df['published_at']).dt.date
-            timeline_data = df.groupby(['date', 'sentiment']).size().reset_index(name='count')
-            
-            fig = px.line(
-                timeline_data, 
-                x='date', 
-                y='count', 
-                color='sentiment',
-                title="News Sentiment Timeline",
-                color_discrete_map={
-                    'Positive': '#00D4AA',
-                    'Negative': '#FF6B6B',
-                    'Neutral': '#4ECDC4'
-                }
-            )
-            
-            fig.update_layout(
-                template="plotly_dark",
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white')
-            )
-            
-            return fig
-        
-        # Fallback empty chart
-        return go.Figure()
+        return _build_news_timeline(news_data)
     
     @staticmethod
     def render_news_filters() -> Dict[str, Any]:
@@ -111,25 +316,29 @@ class NewsComponent:
         with st.sidebar:
             st.header("📰 News Filters")
             
-            # Date range filter
+            # Date range filter; the last-7-days default is seeded once per session
+            if NEWS_DATE_RANGE_KEY not in st.session_state:
+                today = date.today()
+                st.session_state[NEWS_DATE_RANGE_KEY] = (today - timedelta(days=7), today)
+            
             date_range = st.date_input(
                 "Date Range",
-                value=[pd.Timestamp.now() - pd.Timedelta(days=7), pd.Timestamp.now()],
+                key=NEWS_DATE_RANGE_KEY,
                 help="Select date range for news"
             )
             
             # Sentiment filter
             sentiment_filter = st.multiselect(
                 "Sentiment",
-                options=['Positive', 'Negative', 'Neutral'],
-                default=['Positive', 'Negative', 'Neutral'],
+                options=_SENTIMENT_OPTIONS,
+                default=_SENTIMENT_OPTIONS,
                 help="Filter by news sentiment"
             )
             
             # Source filter
             source_filter = st.multiselect(
                 "News Sources",
-                options=['Reuters', 'Bloomberg', 'CNBC', 'Financial Times', 'Wall Street Journal'],
+                options=_SOURCE_OPTIONS,
                 default=[],
                 help="Filter by news source"
             )
@@ -137,7 +346,7 @@ class NewsComponent:
             # Category filter
             category_filter = st.multiselect(
                 "Categories",
-                options=['Earnings', 'Product Launch', 'Market Analysis', 'Merger', 'Partnership'],
+                options=_CATEGORY_OPTIONS,
                 default=[],
                 help="Filter by news category"
             )
@@ -152,35 +361,11 @@ class NewsComponent:
     @staticmethod
     def render_news_summary(news_stats: Dict[str, Any]) -> None:
         """Render news summary metrics"""
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "Total Articles",
-                news_stats.get('total_articles', 0),
-                help="Total number of news articles"
-            )
-        
-        with col2:
-            st.metric(
-                "Avg Sentiment",
-                f"{news_stats.get('average_sentiment', 0):.2f}",
-                help="Average sentiment score (-1 to 1)"
-            )
-        
-        with col3:
-            st.metric(
-                "Most Active Source",
-                news_stats.get('most_active_source', 'N/A'),
-                help="Source with most articles"
-            )
-        
-        with col4:
-            st.metric(
-                "Dominant Category",
-                news_stats.get('dominant_category', 'N/A'),
-                help="Most common news category"
-            )
+        summary = {**_SUMMARY_DEFAULTS, **news_stats}
+        summary['average_sentiment'] = f"{summary['average_sentiment']:.2f}"
+        for field in _SUMMARY_DEFAULTS:
+            summary[field] = html.escape(str(summary[field]))
+        st.markdown(_SUMMARY_TMPL.format_map(summary), unsafe_allow_html=True)
 
 # Create instance for export
 news_component = NewsComponent()
@@ -3,13 +3,104 @@ World Clock Component
 Displays global financial market times and status
 """
 import streamlit as st
-from datetime import datetime
+from datetime import datetime, timezone
+from dataclasses import replace
+from collections import defaultdict
 import pytz
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
-from ...domain.entities.market import Market, MarketStatus, MarketRegion
+from ...domain.entities.market import Market, MarketSnapshot, MarketStatus, MarketRegion
 from datetime import time
 
+# (code, name, country code, flag, timezone, region, open, close, currency) per market
+_MARKET_ROWS = (
+    # Americas
+    ("NYSE", "New York Stock Exchange", "US", "🇺🇸", "America/New_York", MarketRegion.AMERICAS, time(9, 30), time(16, 0), "USD"),
+    ("NASDAQ", "NASDAQ", "US", "🇺🇸", "America/New_York", MarketRegion.AMERICAS, time(9, 30), time(16, 0), "USD"),
+    ("TSX", "Toronto Stock Exchange", "CA", "🇨🇦", "America/Toronto", MarketRegion.AMERICAS, time(9, 30), time(16, 0), "CAD"),
+    ("BOVESPA", "B3 - Brasil Bolsa Balcão", "BR", "🇧🇷", "America/Sao_Paulo", MarketRegion.AMERICAS, time(10, 0), time(17, 0), "BRL"),
+    
+    # Europe
+    ("LSE", "London Stock Exchange", "GB", "🇬🇧", "Europe/London", MarketRegion.EUROPE, time(8, 0), time(16, 30), "GBP"),
+    ("DAX", "Frankfurt Stock Exchange", "DE", "🇩🇪", "Europe/Berlin", MarketRegion.EUROPE, time(9, 0), time(17, 30), "EUR"),
+    ("Euronext", "Euronext Paris", "FR", "🇫🇷", "Europe/Paris", MarketRegion.EUROPE, time(9, 0), time(17, 30), "EUR"),
+    ("BIST", "Borsa Istanbul", "TR", "🇹🇷", "Europe/Istanbul", MarketRegion.EUROPE, time(10, 0), time(18, 0), "TRY"),
+    
+    # Asia-Pacific
+    ("TSE", "Tokyo Stock Exchange", "JP", "🇯🇵", "Asia/Tokyo", MarketRegion.ASIA_PACIFIC, time(9, 0), time(15, 0), "JPY"),
+    ("SSE", "Shanghai Stock Exchange", "CN", "🇨🇳", "Asia/Shanghai", MarketRegion.ASIA_PACIFIC, time(9, 30), time(15, 0), "CNY"),
+    ("HKEX", "Hong Kong Stock Exchange", "HK", "🇭🇰", "Asia/Hong_Kong", MarketRegion.ASIA_PACIFIC, time(9, 30), time(16, 0), "HKD"),
+    ("ASX", "Australian Securities Exchange", "AU", "🇦🇺", "Australia/Sydney", MarketRegion.ASIA_PACIFIC, time(10, 0), time(16, 0), "AUD"),
+    
+    # MENA & Africa
+    ("DFM", "Dubai Financial Market", "AE", "🇦🇪", "Asia/Dubai", MarketRegion.MENA_AFRICA, time(10, 0), time(14, 0), "AED"),
+    ("Tadawul", "Saudi Stock Exchange", "SA", "🇸🇦", "Asia/Riyadh", MarketRegion.MENA_AFRICA, time(10, 0), time(15, 0), "SAR"),
+)
+
+def _build_global_markets() -> tuple[Market, ...]:
+    """Build the static list of global financial markets"""
+    return tuple(Market(*row[:8], currency=row[8]) for row in _MARKET_ROWS)
+
+# Market metadata is static, so it is built once per process rather than per component.
+# These objects are shared by every session and are never modified: status comes from
+# Market.snapshot(), and callers receive copies (see _market_copy).
+_GLOBAL_MARKETS = _build_global_markets()
+
+_REGION_LABELS = {
+    MarketRegion.AMERICAS: "🌎 Americas",
+    MarketRegion.EUROPE: "🌍 Europe",
+    MarketRegion.ASIA_PACIFIC: "🌏 Asia-Pacific",
+    MarketRegion.MENA_AFRICA: "🌍 MENA & Africa"
+}
+
+def _group_markets_by_region(markets: tuple[Market, ...]) -> Dict[str, tuple[Market, ...]]:
+    """Group markets under their region label, in order of first appearance"""
+    groups = defaultdict(list)
+    for market in markets:
+        groups[_REGION_LABELS.get(market.region, "🌍 Other")].append(market)
+    return {label: tuple(members) for label, members in groups.items()}
+
+_MARKETS_BY_REGION = _group_markets_by_region(_GLOBAL_MARKETS)
+
+# Market card markup, filled with str.format_map; the countdown row is appended before the closing </div>
+_MARKET_CARD_TMPL = """
+        <div style="padding: 8px; margin: 4px 0; border-left: 3px solid {status_color}; 
+                    background-color: rgba(255,255,255,0.05); border-radius: 5px;">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <div>
+                    <strong style="font-size: 0.9em;">{display_name}</strong><br>
+                    <span style="font-size: 1.1em; font-weight: bold;">{current_time}</span>
+                    <span style="font-size: 0.8em; color: #888;"> ({current_date})</span>
+                </div>
+                <div style="text-align: right;">
+                    <span style="color: {status_color}; font-weight: bold; font-size: 0.8em;">
+                        {status_emoji} {status_label}
+                    </span><br>
+                    <span style="font-size: 0.7em; color: #666;">
+                        {trading_hours}
+                    </span>
+                </div>
+            </div>
+        """
+
+_MARKET_COUNTDOWN_TMPL = """
+                <div style="margin-top: 4px; font-size: 0.7em; color: #999;">
+                    {label}: {countdown}
+                </div>
+                """
+
+# Last snapshot and card HTML per market code; the visible text changes at most once a minute,
+# so most fragment refreshes reuse the previous markup. Cards hold no per-user data.
+_CARD_HTML_CACHE: Dict[str, Tuple[MarketSnapshot, str]] = {}
+
+# Clock cards show HH:MM, so a 30s refresh keeps them current to within a minute
+CLOCK_REFRESH_INTERVAL = "30s"
+
+@st.fragment(run_every=CLOCK_REFRESH_INTERVAL)
+def _render_world_clock(component: 'WorldClockComponent') -> None:
+    """Fragment body; writes into the container it is called under"""
+    component._render_impl(st)
+
 class WorldClockComponent:
     """
     Component for displaying world financial market clocks
@@ -22,152 +113,93 @@ class WorldClockComponent:
     
     def __init__(self):
         """Initialize with global market data"""
-        self._markets = self._get_global_markets()
+        self._markets = _GLOBAL_MARKETS
+    
+    @staticmethod
+    def _market_copy(market: Market, status: MarketStatus) -> Market:
+        """Caller-owned copy of a shared market with the given current status"""
+        return replace(market, current_status=status,
+                       indices=list(market.indices), metadata=dict(market.metadata))
     
     def render(self, container=None):
         """
         Render the world clock component
         
+        The clock runs as a Streamlit fragment: it refreshes itself every
+        CLOCK_REFRESH_INTERVAL and is not redrawn when other widgets rerun the app.
+        
         Args:
             container: Streamlit container to render in (default: sidebar)
         """
         if container is None:
             container = st.sidebar
         
+        with container:
+            _render_world_clock(self)
+    
+    def _render_impl(self, container):
+        """Write the clock heading and per-region market cards to container"""
+        # Every card is derived from a single clock read
+        now_utc = datetime.now(timezone.utc)
+        
         container.markdown("### 🌍 Global Financial Markets")
         container.markdown("---")
         
-        # Group markets by region
-        regions = self._group_markets_by_region()
-        
-        for region_name, markets in regions.items():
-            with container.expander(f"{region_name} ({len(markets)} markets)"):
-                for market in markets:
-                    self._render_market_card(market, container)
+        # One markdown element per region instead of one per market card
+        for region_name, markets in _MARKETS_BY_REGION.items():
+            expander = container.expander(f"{region_name} ({len(markets)} markets)")
+            expander.markdown(
+                "\n".join(self._market_card_html(market, now_utc) for market in markets),
+                unsafe_allow_html=True
+            )
     
-    def _get_global_markets(self) -> list[Market]:
-        """Get list of global financial markets"""
-        return [
-            # Americas
-            Market("NYSE", "New York Stock Exchange", "US", "🇺🇸", "America/New_York", 
-                   MarketRegion.AMERICAS, time(9, 30), time(16, 0), currency="USD"),
-            Market("NASDAQ", "NASDAQ", "US", "🇺🇸", "America/New_York", 
-                   MarketRegion.AMERICAS, time(9, 30), time(16, 0), currency="USD"),
-            Market("TSX", "Toronto Stock Exchange", "CA", "🇨🇦", "America/Toronto", 
-                   MarketRegion.AMERICAS, time(9, 30), time(16, 0), currency="CAD"),
-            Market("BOVESPA", "B3 - Brasil Bolsa Balcão", "BR", "🇧🇷", "America/Sao_Paulo", 
-                   MarketRegion.AMERICAS, time(10, 0), time(17, 0), currency="BRL"),
-            
-            # Europe
-            Market("LSE", "London Stock Exchange", "GB", "🇬🇧", "Europe/London", 
-                   MarketRegion.EUROPE, time(8, 0), time(16, 30), currency="GBP"),
-            Market("DAX", "Frankfurt Stock Exchange", "DE", "🇩🇪", "Europe/Berlin", 
-                   MarketRegion.EUROPE, time(9, 0), time(17, 30), currency="EUR"),
-            Market("Euronext", "Euronext Paris", "FR", "🇫🇷", "Europe/Paris", 
-                   MarketRegion.EUROPE, time(9, 0), time(17, 30), currency="EUR"),
-            Market("BIST", "Borsa Istanbul", "TR", "🇹🇷", "Europe/Istanbul", 
-                   MarketRegion.EUROPE, time(10, 0), time(18, 0), currency="TRY"),
-            
-            # Asia-Pacific
-            Market("TSE", "Tokyo Stock Exchange", "JP", "🇯🇵", "Asia/Tokyo", 
-                   MarketRegion.ASIA_PACIFIC, time(9, 0), time(15, 0), currency="JPY"),
-            Market("SSE", "Shanghai Stock Exchange", "CN", "🇨🇳", "Asia/Shanghai", 
-                   MarketRegion.ASIA_PACIFIC, time(9, 30), time(15, 0), currency="CNY"),
-            Market("HKEX", "Hong Kong Stock Exchange", "HK", "🇭🇰", "Asia/Hong_Kong", 
-                   MarketRegion.ASIA_PACIFIC, time(9, 30), time(16, 0), currency="HKD"),
-            Market("ASX", "Australian Securities Exchange", "AU", "🇦🇺", "Australia/Sydney", 
-                   MarketRegion.ASIA_PACIFIC, time(10, 0), time(16, 0), currency="AUD"),
-            
-            # MENA & Africa
-            Market("DFM", "Dubai Financial Market", "AE", "🇦🇪", "Asia/Dubai", 
-                   MarketRegion.MENA_AFRICA, time(10, 0), time(14, 0), currency="AED"),
-            Market("Tadawul", "Saudi Stock Exchange", "SA", "🇸🇦", "Asia/Riyadh", 
-                   MarketRegion.MENA_AFRICA, time(10, 0), time(15, 0), currency="SAR"),
-        ]
-    
-    def _group_markets_by_region(self) -> Dict[str, list[Market]]:
-        """Group markets by geographical region"""
-        regions = {
-            "🌎 Americas": [],
-            "🌍 Europe": [],
-            "🌏 Asia-Pacific": [],
-            "🌍 MENA & Africa": []
-        }
-        
-        region_map = {
-            MarketRegion.AMERICAS: "🌎 Americas",
-            MarketRegion.EUROPE: "🌍 Europe", 
-            MarketRegion.ASIA_PACIFIC: "🌏 Asia-Pacific",
-            MarketRegion.MENA_AFRICA: "🌍 MENA & Africa"
-        }
+    def _market_card_html(self, market: Market, now_utc: datetime) -> str:
+        """Card HTML for a market at now_utc, rebuilt only when its snapshot has changed"""
+        snapshot = market.snapshot(now_utc)
         
-        for market in self._markets:
-            region_key = region_map.get(market.region, "🌍 Other")
-            if region_key in regions:
-                regions[region_key].append(market)
+        cached = _CARD_HTML_CACHE.get(market.code)
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
         
-        return regions
+        card_html = self._build_market_card_html(market, snapshot)
+        _CARD_HTML_CACHE[market.code] = (snapshot, card_html)
+        return card_html
     
-    def _render_market_card(self, market: Market, container):
-        """Render individual market card"""
-        # Get current status and time
-        current_time = market.get_formatted_time()
-        current_date = market.get_formatted_date()
-        status = market.current_status
-        
-        # Create market card HTML
-        card_html = f"""
-        <div style="padding: 8px; margin: 4px 0; border-left: 3px solid {market.status_color}; 
-                    background-color: rgba(255,255,255,0.05); border-radius: 5px;">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div>
-                    <strong style="font-size: 0.9em;">{market.display_name}</strong><br>
-                    <span style="font-size: 1.1em; font-weight: bold;">{current_time}</span>
-                    <span style="font-size: 0.8em; color: #888;"> ({current_date})</span>
-                </div>
-                <div style="text-align: right;">
-                    <span style="color: {market.status_color}; font-weight: bold; font-size: 0.8em;">
-                        {market.status_emoji} {status.value.upper()}
-                    </span><br>
-                    <span style="font-size: 0.7em; color: #666;">
-                        {market.get_trading_hours()}
-                    </span>
-                </div>
-            </div>
-        """
+    def _build_market_card_html(self, market: Market, snapshot: MarketSnapshot) -> str:
+        """Build the HTML for an individual market card from its snapshot"""
+        card_html = _MARKET_CARD_TMPL.format_map({
+            'status_color': snapshot.status.color,
+            'display_name': market.display_name,
+            'current_time': snapshot.local_time,
+            'current_date': snapshot.local_date,
+            'status_emoji': snapshot.status.emoji,
+            'status_label': snapshot.status.value.upper(),
+            'trading_hours': market.get_trading_hours()
+        })
         
         # Add countdown information
-        if status == MarketStatus.CLOSED:
-            time_until_open = market.time_until_open()
-            if time_until_open:
-                card_html += f"""
-                <div style="margin-top: 4px; font-size: 0.7em; color: #999;">
-                    Opens in: {time_until_open}
-                </div>
-                """
-        elif status == MarketStatus.OPEN:
-            time_until_close = market.time_until_close()
-            if time_until_close:
-                card_html += f"""
-                <div style="margin-top: 4px; font-size: 0.7em; color: #999;">
-                    Closes in: {time_until_close}
-                </div>
-                """
-        
-        card_html += "</div>"
+        if snapshot.countdown:
+            label = "Closes in" if snapshot.status == MarketStatus.OPEN else "Opens in"
+            card_html += _MARKET_COUNTDOWN_TMPL.format(label=label, countdown=snapshot.countdown)
         
-        container.markdown(card_html, unsafe_allow_html=True)
+        return card_html + "</div>"
     
     def get_market_by_code(self, code: str) -> Market:
         """Get market by code"""
         for market in self._markets:
             if market.code.upper() == code.upper():
-                return market
+                return self._market_copy(market, market.get_current_status())
         return None
     
     def get_open_markets(self) -> list[Market]:
         """Get currently open markets"""
-        return [market for market in self._markets if market.is_trading]
+        now_utc = datetime.now(timezone.utc)
+        open_markets = []
+        for market in self._markets:
+            status = market.snapshot(now_utc).status
+            if status == MarketStatus.OPEN:
+                open_markets.append(self._market_copy(market, status))
+        return open_markets
     
     def get_markets_summary(self) -> Dict[str, Any]:
         """Get summary of all markets"""